@@ -11,7 +11,12 @@ Provides DAPR integration for Django applications following DDD principles:
 from .state import DaprStateClient, StateStore, StateItem, StateOptions
 from .pubsub import DaprPubSubClient, Topic, CloudEvent
 from .client import DaprClient
-from .views import DaprSubscriptionView, dapr_subscribe_handler
+from .views import (
+    build_urlpatterns,
+    dapr_event_handler,
+    dapr_subscribe_handler,
+    finalize_subscriptions,
+)
 
 __all__ = [
     "DaprClient",
@@ -22,6 +27,8 @@ __all__ = [
     "StateOptions",
     "Topic",
     "CloudEvent",
-    "DaprSubscriptionView",
     "dapr_subscribe_handler",
+    "dapr_event_handler",
+    "finalize_subscriptions",
+    "build_urlpatterns",
 ]
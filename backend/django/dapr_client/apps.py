@@ -0,0 +1,24 @@
+"""
+Django app configuration for the DAPR client.
+"""
+
+from importlib import import_module
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class DaprClientConfig(AppConfig):
+    name = 'dapr_client'
+    verbose_name = 'DAPR Client'
+
+    def ready(self):
+        from .views import finalize_subscriptions
+
+        # Handlers register their subscriptions when the module defining
+        # them is imported, typically the URLconf; import it first so the
+        # serialized list is complete before the sidecar's first poll
+        root_urlconf = getattr(settings, 'ROOT_URLCONF', None)
+        if root_urlconf:
+            import_module(root_urlconf)
+        finalize_subscriptions()
@@ -4,19 +4,33 @@ Django DAPR Views
 Provides Django views for DAPR subscription handling.
 """
 
-import json
-from typing import Any, Callable, Dict, List, Optional
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from functools import wraps
 
+import orjson
 from django.http import JsonResponse, HttpRequest, HttpResponse
-from django.views import View
+from django.urls import URLPattern, path as url_path
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 
+logger = logging.getLogger(__name__)
 
 # Global subscription registry
 _subscriptions: List[Dict[str, Any]] = []
 
+# Route -> view registered by dapr_event_handler; a route decorated again
+# (e.g. its module re-imported) keeps a single URL pattern
+_handlers: Dict[str, Callable] = {}
+
+# Static event acknowledgements; DAPR treats DROP as "do not retry"
+_OK_BYTES = orjson.dumps({"success": True})
+_DROP_BYTES = orjson.dumps({"success": False, "status": "DROP"})
+
+# Serialized registry, rebuilt by finalize_subscriptions() after a new
+# subscription is registered
+_subscriptions_bytes: Optional[bytes] = None
+
 
 def register_subscription(
     topic: str,
@@ -27,18 +41,27 @@ def register_subscription(
     """
     Register a subscription for DAPR.
     
+    Registering a topic that is already subscribed on the same pub/sub
+    component is a no-op, so handler modules can be imported more than once.
+    
     Args:
         topic: Topic to subscribe to
         path: Route path for receiving events
         pubsub_name: Pub/Sub component name
         metadata: Optional subscription metadata
     """
+    global _subscriptions_bytes
+    
+    for sub in _subscriptions:
+        if sub["topic"] == topic and sub["pubsubname"] == pubsub_name:
+            return
     _subscriptions.append({
         "pubsubname": pubsub_name,
         "topic": topic,
         "route": path,
         "metadata": metadata or {}
     })
+    _subscriptions_bytes = None
 
 
 def get_subscriptions() -> List[Dict[str, Any]]:
@@ -46,30 +69,37 @@ def get_subscriptions() -> List[Dict[str, Any]]:
     return _subscriptions
 
 
-@method_decorator(csrf_exempt, name='dispatch')
-class DaprSubscriptionView(View):
+def finalize_subscriptions() -> bytes:
     """
-    DAPR Subscription endpoint view.
+    Serialize the subscription registry.
     
-    Returns list of pub/sub subscriptions for DAPR sidecar.
-    Add to urls.py:
-        path('dapr/subscribe', DaprSubscriptionView.as_view()),
+    The encoded list is reused until another subscription is registered.
+    Calling this from ``AppConfig.ready()`` once every handler module has
+    been imported keeps the first sidecar poll cheap; otherwise the list
+    is encoded on that poll.
+    
+    Returns:
+        The JSON-encoded subscription list.
     """
+    global _subscriptions_bytes
     
-    def get(self, request: HttpRequest) -> JsonResponse:
-        """Return subscriptions list."""
-        return JsonResponse(get_subscriptions(), safe=False)
+    if _subscriptions_bytes is None:
+        _subscriptions_bytes = orjson.dumps(_subscriptions)
+    return _subscriptions_bytes
 
 
 @csrf_exempt
-def dapr_subscribe_handler(request: HttpRequest) -> JsonResponse:
+def dapr_subscribe_handler(request: HttpRequest) -> HttpResponse:
     """
     Function-based DAPR subscription handler.
     
     Add to urls.py:
         path('dapr/subscribe', dapr_subscribe_handler),
     """
-    return JsonResponse(get_subscriptions(), safe=False)
+    body = _subscriptions_bytes
+    if body is None:
+        body = finalize_subscriptions()
+    return HttpResponse(body, content_type='application/json')
 
 
 def dapr_event_handler(
@@ -101,13 +131,13 @@ def dapr_event_handler(
         
         @wraps(func)
         @csrf_exempt
-        def handler(request: HttpRequest) -> JsonResponse:
+        def handler(request: HttpRequest) -> HttpResponse:
             if request.method != 'POST':
                 return JsonResponse({"error": "Method not allowed"}, status=405)
             
             try:
                 # Parse event
-                body = json.loads(request.body.decode('utf-8'))
+                body = orjson.loads(request.body)
                 
                 # Extract data from CloudEvent if present
                 if isinstance(body, dict) and "data" in body:
@@ -118,22 +148,36 @@ def dapr_event_handler(
                 # Call handler
                 result = func(data)
                 
-                return JsonResponse({"success": True})
+                return HttpResponse(_OK_BYTES, content_type='application/json')
                 
-            except Exception as e:
+            except Exception:
                 # Return success to prevent retry storm, but log error
-                print(f"Error handling event for {topic}: {e}")
-                return JsonResponse({"success": False, "status": "DROP"})
+                logger.exception("Error handling event for %s", topic)
+                return HttpResponse(_DROP_BYTES, content_type='application/json')
         
         # Attach metadata to handler
         handler._dapr_topic = topic
         handler._dapr_path = path
+        _handlers[path] = handler
         
         return handler
     
     return decorator
 
 
+def build_urlpatterns() -> Tuple[URLPattern, ...]:
+    """
+    Build URL patterns for every handler registered via dapr_event_handler.
+    
+    Import the modules defining the handlers first, then add to urls.py:
+        urlpatterns = [...] + list(build_urlpatterns())
+    
+    Returns:
+        One URL pattern per registered handler route.
+    """
+    return tuple(url_path(route.lstrip('/'), handler) for route, handler in _handlers.items())
+
+
 class DaprEventViewMixin:
     """
     Mixin for class-based DAPR event handlers.
@@ -153,10 +197,10 @@ class DaprEventViewMixin:
     def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         return super().dispatch(request, *args, **kwargs)  # type: ignore
     
-    def post(self, request: HttpRequest) -> JsonResponse:
+    def post(self, request: HttpRequest) -> HttpResponse:
         """Handle incoming event."""
         try:
-            body = json.loads(request.body.decode('utf-8'))
+            body = orjson.loads(request.body)
             
             # Extract data from CloudEvent if present
             if isinstance(body, dict) and "data" in body:
@@ -167,11 +211,11 @@ class DaprEventViewMixin:
             # Call handler
             self.handle_event(data)
             
-            return JsonResponse({"success": True})
+            return HttpResponse(_OK_BYTES, content_type='application/json')
             
-        except Exception as e:
-            print(f"Error handling event for {self.topic}: {e}")
-            return JsonResponse({"success": False, "status": "DROP"})
+        except Exception:
+            logger.exception("Error handling event for %s", self.topic)
+            return HttpResponse(_DROP_BYTES, content_type='application/json')
     
     def handle_event(self, event_data: Dict[str, Any]) -> None:
         """
@@ -0,0 +1,26 @@
+"""
+Logging handlers for the MTG project.
+"""
+
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+
+class QueueStreamHandler(QueueHandler):
+    """
+    Console handler that keeps stream writes off the request thread.
+    
+    Records are formatted by this handler (so the LOGGING formatter
+    applies) and enqueued; a QueueListener thread writes them to stderr.
+    Equivalent to dictConfig's QueueHandler support, which only exists
+    on Python 3.12+.
+    """
+    
+    def __init__(self):
+        queue = SimpleQueue()
+        super().__init__(queue)
+        self.listener = QueueListener(queue, logging.StreamHandler())
+        self.listener.start()
+        atexit.register(self.listener.stop)
@@ -3,6 +3,7 @@ URL configuration for MTG project.
 
 Includes DAPR integration for state management and pub/sub messaging.
 """
+import logging
 import sys
 import os
 
@@ -13,65 +14,28 @@ from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
 
-# DAPR subscription configuration
-DAPR_SUBSCRIPTIONS = [
-    {
-        "pubsubname": "pubsub",
-        "topic": "tcg.card.added",
-        "route": "/events/tcg/card/added",
-        "metadata": {}
-    },
-    {
-        "pubsubname": "pubsub",
-        "topic": "tcg.deck.created",
-        "route": "/events/tcg/deck/created",
-        "metadata": {}
-    },
-    {
-        "pubsubname": "pubsub",
-        "topic": "user.created",
-        "route": "/events/user/created",
-        "metadata": {}
-    }
-]
-
+from dapr_client.views import build_urlpatterns, dapr_event_handler, dapr_subscribe_handler
 
-def dapr_subscribe(request):
-    """DAPR subscription endpoint."""
-    return JsonResponse(DAPR_SUBSCRIPTIONS, safe=False)
+logger = logging.getLogger(__name__)
 
 
-def handle_card_added(request):
+# DAPR event handlers; each registers its subscription and route
+@dapr_event_handler("tcg.card.added")
+def handle_card_added(data):
     """Handle TCG card added events."""
-    import json
-    if request.method == 'POST':
-        event = json.loads(request.body)
-        data = event.get("data", event)
-        print(f"[MTG] Card added event: {data}")
-        return JsonResponse({"success": True})
-    return JsonResponse({"error": "Method not allowed"}, status=405)
+    logger.debug("Card added event: %s", data)
 
 
-def handle_deck_created(request):
+@dapr_event_handler("tcg.deck.created")
+def handle_deck_created(data):
     """Handle TCG deck created events."""
-    import json
-    if request.method == 'POST':
-        event = json.loads(request.body)
-        data = event.get("data", event)
-        print(f"[MTG] Deck created event: {data}")
-        return JsonResponse({"success": True})
-    return JsonResponse({"error": "Method not allowed"}, status=405)
+    logger.debug("Deck created event: %s", data)
 
 
-def handle_user_created(request):
+@dapr_event_handler("user.created")
+def handle_user_created(data):
     """Handle user created events."""
-    import json
-    if request.method == 'POST':
-        event = json.loads(request.body)
-        data = event.get("data", event)
-        print(f"[MTG] User created event: {data}")
-        return JsonResponse({"success": True})
-    return JsonResponse({"error": "Method not allowed"}, status=405)
+    logger.debug("User created event: %s", data)
 
 
 def health_check(request):
@@ -107,10 +71,8 @@ urlpatterns = [
     path('api/v1/info', api_info),
     
     # DAPR subscription endpoint
-    path('dapr/subscribe', dapr_subscribe),
-    
-    # DAPR event handlers
-    path('events/tcg/card/added', handle_card_added),
-    path('events/tcg/deck/created', handle_deck_created),
-    path('events/user/created', handle_user_created),
+    path('dapr/subscribe', dapr_subscribe_handler),
 ]
+
+# DAPR event handlers registered above
+urlpatterns += list(build_urlpatterns())
@@ -0,0 +1,98 @@
+import unittest
+from dataclasses import fields
+from spellbook.application.use_cases.search_variants import SearchVariantsRequest, SearchVariantsUseCase, VariantSummaryDTO
+from spellbook.domain.repositories import VariantRepository
+from ddd.repositories import RepositoryError
+
+
+class SummaryRowsRepository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.count_calls = 0
+
+    def _matching(self, identity=None, **filters):
+        return [row for row in self.rows if identity is None or row[3] == identity]
+
+    def search_summaries(self, *, limit, cursor=None, offset=0, **filters):
+        rows = [row for row in self._matching(**filters) if cursor is None or row[0] > cursor]
+        return iter(rows[offset:offset + limit])
+
+    def search_count(self, **filters):
+        self.count_calls += 1
+        return len(self._matching(**filters))
+
+
+class DictCache(dict):
+    def get(self, key, default=None):
+        return super().get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self[key] = value
+
+    def add(self, key, value, timeout=None):
+        return self.setdefault(key, value) is value
+
+    def incr(self, key, delta=1):
+        self[key] += delta
+        return self[key]
+
+
+class SearchVariantsSummaryTests(unittest.TestCase):
+    def setUp(self):
+        self.rows = [(i, f'u{i}', f'V{i}', 'WU' if i % 2 else 'B', i + 1, None if i % 2 else 3, 1.5 * i) for i in range(1, 6)]
+        self.repository = SummaryRowsRepository(self.rows)
+        self.use_case = SearchVariantsUseCase(self.repository)
+
+    def test_dto_fields_follow_summary_fields(self):
+        self.assertEqual(tuple(f.name for f in fields(VariantSummaryDTO)), VariantRepository.SUMMARY_FIELDS)
+
+    def test_dtos_built_from_summary_rows(self):
+        response = self.use_case.execute(SearchVariantsRequest(page_size=3))
+        self.assertIsNone(response.error)
+        self.assertEqual(response.variants, [VariantSummaryDTO(*row) for row in self.rows[:3]])
+        self.assertEqual(response.variants[1].card_count, 3)
+        self.assertEqual(response.variants[1].bracket, 3)
+        self.assertTrue(response.has_next)
+        self.assertEqual(response.next_cursor, 3)
+
+    def test_last_page_from_cursor(self):
+        response = self.use_case.execute(SearchVariantsRequest(page_size=3, cursor=3))
+        self.assertEqual([v.id for v in response.variants], [4, 5])
+        self.assertFalse(response.has_next)
+        self.assertIsNone(response.next_cursor)
+
+    def test_total_count_uses_request_filters(self):
+        use_case = SearchVariantsUseCase(self.repository, cache=DictCache())
+        response = use_case.execute(SearchVariantsRequest(identity='B', include_total=True, cursor=0))
+        self.assertEqual(response.total_count, 2)
+        response = use_case.execute(SearchVariantsRequest(identity='WU', include_total=True, cursor=0))
+        self.assertEqual(response.total_count, 3)
+        response = use_case.execute(SearchVariantsRequest(identity='B', include_total=True, cursor=2))
+        self.assertEqual(response.total_count, 2)
+        self.assertEqual(self.repository.count_calls, 2)
+        self.assertIsNone(use_case.execute(SearchVariantsRequest()).total_count)
+
+    def test_repository_errors_are_reported(self):
+        def fail(**kwargs):
+            raise RepositoryError('database unavailable')
+        self.repository.search_summaries = fail
+        with self.assertLogs('spellbook.application.use_cases.search_variants'):
+            response = self.use_case.execute(SearchVariantsRequest())
+        self.assertEqual(response.error, 'database unavailable')
+
+    def test_cache_errors_are_reported(self):
+        cache = DictCache()
+        use_case = SearchVariantsUseCase(self.repository, cache=cache)
+        def fail(key, value, timeout=None):
+            raise ConnectionError('cache unavailable')
+        cache.set = fail
+        with self.assertLogs('spellbook.application.use_cases.search_variants'):
+            response = use_case.execute(SearchVariantsRequest(include_total=True, cursor=0))
+        self.assertEqual(response.error, 'cache unavailable')
+
+    def test_programming_errors_propagate(self):
+        def fail(**kwargs):
+            raise TypeError('bad filter')
+        self.repository.search_summaries = fail
+        with self.assertRaises(TypeError):
+            self.use_case.execute(SearchVariantsRequest())
@@ -4,42 +4,81 @@ Estimate Bracket use case.
 Application service for estimating Commander deck power level brackets.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
+from typing import List, Optional, Sequence, Tuple
 
 # Domain imports (handles shared lib path setup)
 from ...domain.services import BracketEstimatorService
-from ...domain.services.bracket_estimator import BracketBreakdown
+from ...domain.services.bracket_estimator import (
+    BracketBreakdown,
+    BracketEstimateRequest,
+)
 
 from ddd.services import ApplicationService
 
 
-@dataclass
+@dataclass(slots=True)
 class EstimateBracketRequest:
     """Request DTO for Estimate Bracket use case."""
     card_names: List[str]
     commander_names: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EstimateBracketResponse:
     """Response DTO for Estimate Bracket use case."""
     bracket: int = 1
     confidence: float = 0.0
     breakdown: Optional[BracketBreakdown] = None
-    warnings: List[str] = field(default_factory=list)
+    warnings: Sequence[str] = ()
     error: Optional[str] = None
 
 
+# (bracket, confidence, breakdown, warnings); the breakdown is a private
+# copy that is never handed out, so cached entries cannot be mutated
+_CachedEstimate = Tuple[int, float, BracketBreakdown, Tuple[str, ...]]
+
+
+def _estimate(
+    estimator: BracketEstimatorService,
+    card_names: Tuple[str, ...],
+    commander_names: Optional[Tuple[str, ...]]
+) -> _CachedEstimate:
+    """Run the domain estimation for a canonicalized deck."""
+    result = estimator.estimate_bracket(BracketEstimateRequest(
+        card_names=list(card_names),
+        commander_names=list(commander_names) if commander_names is not None else None
+    ))
+    return (
+        result.bracket,
+        result.confidence,
+        replace(result.breakdown),
+        tuple(result.warnings or ()),
+    )
+
+
 class EstimateBracketUseCase(ApplicationService[EstimateBracketRequest, EstimateBracketResponse]):
     """
     Application service for estimating deck power brackets.
     
     Orchestrates bracket estimation using the domain service.
+    
+    Estimation is a pure function of the deck, so results are memoized
+    per use case, keyed by the sorted card and commander names. The cache
+    lives and dies with the estimator it was built for; call cache_clear
+    after reconfiguring that estimator.
     """
     
+    CACHE_SIZE = 4096
+    
     def __init__(self, bracket_estimator: BracketEstimatorService):
         self._bracket_estimator = bracket_estimator
+        self._estimate = lru_cache(maxsize=self.CACHE_SIZE)(partial(_estimate, bracket_estimator))
+    
+    def cache_clear(self) -> None:
+        """Drop all memoized estimations."""
+        self._estimate.cache_clear()
     
     def execute(self, request: EstimateBracketRequest) -> EstimateBracketResponse:
         """
@@ -52,20 +91,17 @@ class EstimateBracketUseCase(ApplicationService[EstimateBracketRequest, Estimate
             Response with bracket estimation.
         """
         try:
-            from ...domain.services.bracket_estimator import BracketEstimateRequest
-            
-            domain_request = BracketEstimateRequest(
-                card_names=request.card_names,
-                commander_names=request.commander_names
+            commander_names = request.commander_names
+            bracket, confidence, breakdown, warnings = self._estimate(
+                tuple(sorted(request.card_names)),
+                tuple(sorted(commander_names)) if commander_names is not None else None
             )
             
-            result = self._bracket_estimator.estimate_bracket(domain_request)
-            
             return EstimateBracketResponse(
-                bracket=result.bracket,
-                confidence=result.confidence,
-                breakdown=result.breakdown,
-                warnings=result.warnings
+                bracket=bracket,
+                confidence=confidence,
+                breakdown=replace(breakdown),
+                warnings=warnings
             )
             
         except Exception as e:
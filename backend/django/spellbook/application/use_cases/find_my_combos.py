@@ -5,17 +5,18 @@ Application service for finding combos based on user's card collection.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 # Domain imports (handles shared lib path setup)
 from ...domain.entities import VariantEntity
 from ...domain.repositories import CardRepository, VariantRepository
 from ...domain.services import ComboFinderService
+from ...domain.services.combo_finder import ComboSearchCriteria
 
 from ddd.services import ApplicationService
 
 
-@dataclass
+@dataclass(slots=True)
 class FindMyCombosRequest:
     """Request DTO for Find My Combos use case."""
     card_names: List[str]
@@ -28,7 +29,7 @@ class FindMyCombosRequest:
     almost_missing_limit: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class VariantDTO:
     """Data transfer object for variant information."""
     id: int
@@ -44,7 +45,7 @@ class VariantDTO:
     price_tcgplayer: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FindMyCombosResponse:
     """Response DTO for Find My Combos use case."""
     included_variants: List[VariantDTO] = field(default_factory=list)
@@ -54,6 +55,28 @@ class FindMyCombosResponse:
     error: Optional[str] = None
 
 
+def variant_to_jsonable(variant: VariantEntity) -> Dict[str, Any]:
+    """
+    Project a variant entity straight to a JSON-ready dict.
+    
+    Exposes the same fields as VariantDTO, for HTTP views that serialize
+    results directly (e.g. with orjson) and never need the DTO itself.
+    """
+    return {
+        "id": variant.id or 0,
+        "unique_id": variant.unique_id,
+        "name": variant.name,
+        "identity": variant.identity,
+        "card_names": [],
+        "feature_names": [],
+        "mana_needed": variant.mana_needed,
+        "description": variant.description,
+        "notes": variant.notes,
+        "bracket": variant.bracket,
+        "price_tcgplayer": variant.price_tcgplayer,
+    }
+
+
 class FindMyCombosUseCase(ApplicationService[FindMyCombosRequest, FindMyCombosResponse]):
     """
     Application service for finding combos with user's cards.
@@ -84,13 +107,14 @@ class FindMyCombosUseCase(ApplicationService[FindMyCombosRequest, FindMyCombosRe
         Returns:
             Response with matching combos/variants.
         """
+        card_names = [name for name in (n.strip() for n in request.card_names) if name]
+        if not card_names:
+            return FindMyCombosResponse(error="No card names provided")
+        
         try:
-            # Resolve card names to IDs
-            card_ids = []
-            for name in request.card_names:
-                card = self._card_repository.get_by_name(name)
-                if card and card.id:
-                    card_ids.append(card.id)
+            # Resolve card names to IDs in a single repository round-trip
+            name_to_id = self._card_repository.get_ids_by_names(card_names)
+            card_ids = list(name_to_id.values())
             
             if not card_ids:
                 return FindMyCombosResponse(
@@ -98,7 +122,6 @@ class FindMyCombosUseCase(ApplicationService[FindMyCombosRequest, FindMyCombosRe
                 )
             
             # Find variants using the domain service
-            from ...domain.services.combo_finder import ComboSearchCriteria
             criteria = ComboSearchCriteria(
                 card_ids=card_ids,
                 identity=request.identity,
@@ -5,7 +5,8 @@ Application service for retrieving detailed variant information.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 
 # Domain imports (handles shared lib path setup)
 from ...domain.entities import VariantEntity
@@ -13,8 +14,11 @@ from ...domain.repositories import VariantRepository, CardRepository, FeatureRep
 
 from ddd.services import ApplicationService
 
+# Shared read-only default for DTOs without legality data
+_EMPTY_MAPPING: Mapping[str, bool] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True)
 class CardDetailDTO:
     """Detailed card information."""
     id: int
@@ -24,7 +28,7 @@ class CardDetailDTO:
     image_uri: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureDetailDTO:
     """Detailed feature information."""
     id: int
@@ -32,14 +36,14 @@ class FeatureDetailDTO:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GetVariantDetailsRequest:
     """Request DTO for Get Variant Details use case."""
     variant_id: Optional[int] = None
     unique_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VariantDetailsDTO:
     """Detailed variant DTO with full information."""
     id: int
@@ -69,10 +73,10 @@ class VariantDetailsDTO:
     price_cardmarket: Optional[float] = None
     
     # Legalities
-    legalities: dict = field(default_factory=dict)
+    legalities: Mapping[str, bool] = field(default_factory=lambda: _EMPTY_MAPPING)
 
 
-@dataclass
+@dataclass(slots=True)
 class GetVariantDetailsResponse:
     """Response DTO for Get Variant Details use case."""
     variant: Optional[VariantDetailsDTO] = None
@@ -118,29 +122,31 @@ class GetVariantDetailsUseCase(ApplicationService[GetVariantDetailsRequest, GetV
             if not variant:
                 return GetVariantDetailsResponse(error="Variant not found")
             
-            # Assemble cards
-            cards = []
-            for card_id in variant.card_ids:
-                card = self._card_repository.get_by_id(card_id)
-                if card:
-                    cards.append(CardDetailDTO(
-                        id=card.id or 0,
-                        name=card.name,
-                        type_line=card.type_line,
-                        mana_value=card.mana_value,
-                        image_uri=card.image_uri_front_normal
-                    ))
+            # Assemble cards (one batched lookup, variant order preserved)
+            cards_map = self._card_repository.get_many(variant.card_ids)
+            cards = [
+                CardDetailDTO(
+                    id=card.id or 0,
+                    name=card.name,
+                    type_line=card.type_line,
+                    mana_value=card.mana_value,
+                    image_uri=card.image_uri_front_normal
+                )
+                for card in (cards_map.get(card_id) for card_id in variant.card_ids)
+                if card
+            ]
             
-            # Assemble features
-            features = []
-            for feature_id in variant.feature_produced_ids:
-                feature = self._feature_repository.get_by_id(feature_id)
-                if feature:
-                    features.append(FeatureDetailDTO(
-                        id=feature.id or 0,
-                        name=feature.name,
-                        description=feature.description
-                    ))
+            # Assemble features (one batched lookup, variant order preserved)
+            features_map = self._feature_repository.get_many(variant.feature_produced_ids)
+            features = [
+                FeatureDetailDTO(
+                    id=feature.id or 0,
+                    name=feature.name,
+                    description=feature.description
+                )
+                for feature in (features_map.get(feature_id) for feature_id in variant.feature_produced_ids)
+                if feature
+            ]
             
             # Build response DTO
             variant_dto = VariantDetailsDTO(
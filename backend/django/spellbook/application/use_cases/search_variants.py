@@ -4,35 +4,54 @@ Search Variants use case.
 Application service for searching variants with various filters.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+import hashlib
+import logging
+from dataclasses import astuple, dataclass, field
+from itertools import islice
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Tuple, Type
 
 # Domain imports (handles shared lib path setup)
-from ...domain.entities import VariantEntity
 from ...domain.repositories import VariantRepository
 
+from ddd.repositories import RepositoryError
 from ddd.services import ApplicationService
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchVariantsRequest:
     """Request DTO for Search Variants use case."""
     query: Optional[str] = None
     identity: Optional[str] = None
     format_name: Optional[str] = None
-    feature_ids: Optional[List[int]] = None
-    card_ids: Optional[List[int]] = None
+    feature_ids: Optional[FrozenSet[int]] = None
+    card_ids: Optional[FrozenSet[int]] = None
     min_cards: Optional[int] = None
     max_cards: Optional[int] = None
     max_price: Optional[float] = None
     include_spoilers: bool = False
-    page: int = 1
+    cursor: Optional[int] = None
+    page: int = 1  # Deprecated: offset pagination, use cursor instead
     page_size: int = 20
+    include_total: bool = False
+    
+    def __post_init__(self):
+        # Deduplicate ID filters once at the boundary
+        if self.feature_ids is not None:
+            self.feature_ids = frozenset(self.feature_ids)
+        if self.card_ids is not None:
+            self.card_ids = frozenset(self.card_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class VariantSummaryDTO:
-    """Summary DTO for variant search results."""
+    """
+    Summary DTO for variant search results.
+    
+    Fields are declared in VariantRepository.SUMMARY_FIELDS order, so
+    summary rows are passed to the constructor positionally.
+    """
     id: int
     unique_id: str
     name: str
@@ -42,26 +61,109 @@ class VariantSummaryDTO:
     price_tcgplayer: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchVariantsResponse:
     """Response DTO for Search Variants use case."""
     variants: List[VariantSummaryDTO] = field(default_factory=list)
-    total_count: int = 0
+    total_count: Optional[int] = None
     page: int = 1
     page_size: int = 20
     has_next: bool = False
+    next_cursor: Optional[int] = None
     error: Optional[str] = None
 
 
+class ResultCache(Protocol):
+    """Minimal cache interface (satisfied by Django's cache backends)."""
+    
+    def get(self, key: str, default: Any = None) -> Any: ...
+    
+    def set(self, key: str, value: Any, timeout: Optional[float] = None) -> None: ...
+    
+    def add(self, key: str, value: Any, timeout: Optional[float] = None) -> bool: ...
+    
+    def incr(self, key: str, delta: int = 1) -> int: ...
+
+
 class SearchVariantsUseCase(ApplicationService[SearchVariantsRequest, SearchVariantsResponse]):
     """
     Application service for searching variants.
     
     Provides flexible variant search with multiple filter options.
+    
+    The total count is only computed when requested. It is counted with
+    the request's filters and, when a cache is given, cached per filter
+    set for COUNT_TTL seconds since it can scan large tables.
+    
+    When a cache is given, responses for the first MAX_CACHED_PAGE pages
+    are cached for CACHE_TTL seconds, keyed by a hash of the request.
+    Cursor requests are never cached, since every cursor position would
+    get its own entry. Call invalidate_cache() after variant writes.
+    
+    Repository failures (RepositoryError) and cache failures (cache_errors,
+    OSError by default; pass e.g. redis.RedisError for a Redis backend)
+    are reported in the response error; anything else propagates.
     """
     
-    def __init__(self, variant_repository: VariantRepository):
+    COUNT_TTL = 30
+    CACHE_TTL = 30
+    MAX_CACHED_PAGE = 3
+    CACHE_VERSION_KEY = 'variants:search:version'
+    
+    def __init__(
+        self,
+        variant_repository: VariantRepository,
+        cache: Optional[ResultCache] = None,
+        cache_errors: Tuple[Type[Exception], ...] = (OSError,)
+    ):
         self._variant_repository = variant_repository
+        self._cache = cache
+        self._errors = (RepositoryError, *cache_errors)
+    
+    def invalidate_cache(self) -> None:
+        """Invalidate all cached search results by bumping the key version."""
+        if self._cache is not None:
+            # add + incr so concurrent bumps are never lost
+            self._cache.add(self.CACHE_VERSION_KEY, 0, None)
+            self._cache.incr(self.CACHE_VERSION_KEY)
+    
+    def _cache_key(self, kind: str, values: Tuple[Any, ...]) -> str:
+        """Build the cache key for request values under the current version."""
+        version = self._cache.get(self.CACHE_VERSION_KEY) or 0
+        # Sort set fields: their iteration order depends on the per-process
+        # string hash seed, and keys must match across workers
+        values = tuple(
+            tuple(sorted(value)) if isinstance(value, frozenset) else value
+            for value in values
+        )
+        digest = hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+        return f'variants:{kind}:v{version}:{digest}'
+    
+    @staticmethod
+    def _filters(request: SearchVariantsRequest) -> Dict[str, Any]:
+        """Get the repository filter arguments for a request."""
+        return dict(
+            identity=request.identity,
+            format_name=request.format_name,
+            feature_ids=request.feature_ids,
+            card_ids=request.card_ids,
+            min_cards=request.min_cards,
+            max_cards=request.max_cards,
+            max_price=request.max_price,
+            include_spoilers=request.include_spoilers,
+            text_query=request.query
+        )
+    
+    def _total_count(self, filters: Dict[str, Any]) -> int:
+        """Count the variants matching filters, cached for COUNT_TTL seconds."""
+        if self._cache is None:
+            return self._variant_repository.search_count(**filters)
+        key = self._cache_key('count', tuple(filters.values()))
+        total = self._cache.get(key)
+        if total is None:
+            total = self._variant_repository.search_count(**filters)
+            self._cache.set(key, total, self.COUNT_TTL)
+        return total
     
     def execute(self, request: SearchVariantsRequest) -> SearchVariantsResponse:
         """
@@ -73,50 +175,59 @@ class SearchVariantsUseCase(ApplicationService[SearchVariantsRequest, SearchVari
         Returns:
             Response with matching variants.
         """
-        try:
-            # Calculate pagination
+        if (
+            self._cache is None
+            or request.cursor is not None
+            or request.page > self.MAX_CACHED_PAGE
+        ):
+            return self._search(request)
+        
+        key = self._cache_key('search', astuple(request))
+        response = self._cache.get(key)
+        if response is None:
+            response = self._search(request)
+            if response.error is None:
+                self._cache.set(key, response, self.CACHE_TTL)
+        return response
+    
+    def _search(self, request: SearchVariantsRequest) -> SearchVariantsResponse:
+        """Run the search against the repository."""
+        # Calculate pagination
+        limit = request.page_size + 1  # +1 to check for next page
+        offset = 0
+        if request.cursor is None and request.page > 1:
+            # Legacy offset pagination
             offset = (request.page - 1) * request.page_size
-            limit = request.page_size + 1  # +1 to check for next page
-            
-            # Get variants based on filters
-            variants: List[VariantEntity] = []
-            
-            if request.identity:
-                variants = self._variant_repository.search_by_identity(request.identity)
-            elif request.format_name:
-                variants = self._variant_repository.get_legal_variants(
-                    request.format_name, 
-                    limit=limit
-                )
-            else:
-                variants = self._variant_repository.get_all(limit=limit, offset=offset)
-            
-            # Check if there are more results
-            has_next = len(variants) > request.page_size
-            if has_next:
-                variants = variants[:request.page_size]
-            
-            # Transform to DTOs
+        
+        filters = self._filters(request)
+        
+        try:
+            # Get summary rows with every filter applied by the repository
+            rows = iter(self._variant_repository.search_summaries(
+                **filters,
+                limit=limit,
+                cursor=request.cursor,
+                offset=offset
+            ))
+            # Stream the page straight into DTOs; rows may be fetched lazily,
+            # so consuming them stays inside the try
             variant_dtos = [
-                VariantSummaryDTO(
-                    id=v.id or 0,
-                    unique_id=v.unique_id,
-                    name=v.name,
-                    identity=v.identity,
-                    card_count=v.card_count,
-                    bracket=v.bracket,
-                    price_tcgplayer=v.price_tcgplayer
-                )
-                for v in variants
+                VariantSummaryDTO(*row) for row in islice(rows, request.page_size)
             ]
-            
-            return SearchVariantsResponse(
-                variants=variant_dtos,
-                total_count=self._variant_repository.count(),
-                page=request.page,
-                page_size=request.page_size,
-                has_next=has_next
-            )
-            
-        except Exception as e:
+            # Probe the extra row to check if there are more results
+            has_next = next(rows, None) is not None
+            total_count = self._total_count(filters) if request.include_total else None
+        except self._errors as e:
+            logger.exception("Variant search failed")
             return SearchVariantsResponse(error=str(e))
+        
+        next_cursor = variant_dtos[-1].id if has_next else None
+        
+        return SearchVariantsResponse(
+            variants=variant_dtos,
+            total_count=total_count,
+            page=request.page,
+            page_size=request.page_size,
+            has_next=has_next,
+            next_cursor=next_cursor
+        )
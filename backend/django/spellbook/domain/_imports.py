@@ -5,47 +5,55 @@ Provides helpers for importing shared libraries when they may not be
 installed as packages.
 """
 
+import importlib
+import importlib.util
 import sys
 from pathlib import Path
 from typing import Optional
 
-_LIBS_PATH: Optional[Path] = None
+# Lexical parent navigation: __file__ is already absolute, and skipping
+# resolve() avoids symlink syscalls on cold start
+_LIBS_PATH = Path(__file__).parents[4] / 'libs' / 'shared' / 'python'
+_LIBS_PATH_EXISTS: Optional[bool] = None
+_ENSURED = False
 
 
 def get_shared_libs_path() -> Path:
     """
     Get the path to the shared Python libraries.
-    
+
     Returns:
         Path to libs/shared/python directory.
     """
-    global _LIBS_PATH
-    
-    if _LIBS_PATH is None:
-        # Calculate path relative to this file
-        current_file = Path(__file__).resolve()
-        _LIBS_PATH = current_file.parents[4] / 'libs' / 'shared' / 'python'
-    
     return _LIBS_PATH
 
 
 def ensure_shared_libs_importable() -> None:
     """
     Ensure the shared libraries are importable.
-    
+
     Adds the shared libs path to sys.path if not already present
-    and if the ddd package is not already importable.
+    and if the ddd package is not already importable. Only the first
+    call does any work.
     """
-    try:
-        import ddd  # noqa: F401
+    global _ENSURED, _LIBS_PATH_EXISTS
+
+    if _ENSURED:
+        return
+    _ENSURED = True
+
+    if importlib.util.find_spec('ddd') is not None:
         return  # Already importable
-    except ImportError:
-        pass
-    
+
     libs_path = get_shared_libs_path()
-    
-    if libs_path.exists() and str(libs_path) not in sys.path:
+
+    if _LIBS_PATH_EXISTS is None:
+        _LIBS_PATH_EXISTS = libs_path.exists()
+
+    if _LIBS_PATH_EXISTS and str(libs_path) not in sys.path:
         sys.path.insert(0, str(libs_path))
+        # Drop finder caches built before the path existed (runs once)
+        importlib.invalidate_caches()
 
 
 # Auto-initialize on import
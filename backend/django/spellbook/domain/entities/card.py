@@ -5,13 +5,13 @@ Represents a Magic: The Gathering card in the Commander Spellbook domain.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import FrozenSet, Optional, Tuple
 from uuid import UUID
 
 from .base import AggregateRoot
 
 
-@dataclass
+@dataclass(slots=True)
 class CardEntity(AggregateRoot[int]):
     """
     Domain entity representing a Magic: The Gathering card.
@@ -24,7 +24,7 @@ class CardEntity(AggregateRoot[int]):
     oracle_id: Optional[UUID] = None
     type_line: str = ""
     oracle_text: str = ""
-    keywords: List[str] = field(default_factory=list)
+    keywords: Tuple[str, ...] = ()
     mana_value: int = 0
     identity: str = ""
     
@@ -55,6 +55,15 @@ class CardEntity(AggregateRoot[int]):
     # Statistics
     variant_count: int = 0
     
+    # Lowercased keywords, built once in __post_init__
+    _keywords_lower: FrozenSet[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self.keywords = tuple(self.keywords)
+        self._keywords_lower = frozenset(k.lower() for k in self.keywords)
+    
     def validate(self) -> bool:
         """Validate card entity state."""
         if not self.name:
@@ -67,7 +76,7 @@ class CardEntity(AggregateRoot[int]):
     
     def has_keyword(self, keyword: str) -> bool:
         """Check if card has a specific keyword."""
-        return keyword.lower() in [k.lower() for k in self.keywords]
+        return keyword.lower() in self._keywords_lower
     
     @property
     def scryfall_link(self) -> Optional[str]:
@@ -7,7 +7,8 @@ Represents a combo (combination of cards) in the Commander Spellbook domain.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
 from .base import AggregateRoot
 
@@ -20,7 +21,13 @@ class ComboStatus(Enum):
     NEEDS_REVIEW = 'NR'
 
 
-@dataclass
+# Raw value -> member lookup for row hydration, bypassing EnumMeta.__call__
+COMBO_STATUS_BY_VALUE: Mapping[str, ComboStatus] = MappingProxyType(
+    ComboStatus._value2member_map_
+)
+
+
+@dataclass(slots=True)
 class ComboEntity(AggregateRoot[int]):
     """
     Domain entity representing a combo (combination of cards and effects).
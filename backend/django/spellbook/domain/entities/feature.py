@@ -10,7 +10,7 @@ from typing import List, Optional
 from .base import AggregateRoot
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureEntity(AggregateRoot[int]):
     """
     Domain entity representing a feature (effect or characteristic).
@@ -10,7 +10,7 @@ from typing import List, Optional
 from .base import AggregateRoot
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateEntity(AggregateRoot[int]):
     """
     Domain entity representing a template (abstract card requirement).
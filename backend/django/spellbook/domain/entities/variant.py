@@ -7,7 +7,9 @@ in the Commander Spellbook domain.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional
 
 from .base import AggregateRoot
 
@@ -38,7 +40,41 @@ class LegalityFormat(Enum):
     PAUPER = 'pauper'
 
 
-@dataclass
+# Raw value -> member lookups for row hydration, bypassing EnumMeta.__call__
+# (e.g. VARIANT_STATUS_BY_VALUE['OK']); unknown values raise KeyError
+VARIANT_STATUS_BY_VALUE: Mapping[str, VariantStatus] = MappingProxyType(
+    VariantStatus._value2member_map_
+)
+LEGALITY_FORMAT_BY_VALUE: Mapping[str, LegalityFormat] = MappingProxyType(
+    LegalityFormat._value2member_map_
+)
+
+# One bit per LegalityFormat, in declaration order
+FORMAT_BITS: Mapping[str, int] = MappingProxyType(
+    {f.value: 1 << i for i, f in enumerate(LegalityFormat)}
+)
+
+
+@lru_cache(maxsize=None)
+def legal_formats_for(mask: int) -> FrozenSet[str]:
+    """Get the format names set in a legality bitmask, shared per mask value."""
+    return frozenset(name for name, bit in FORMAT_BITS.items() if mask & bit)
+
+
+def legal_mask_from(legalities: Mapping[str, bool]) -> int:
+    """
+    Build a legality bitmask from a format name -> legal mapping.
+    
+    Formats that are not LegalityFormat values are ignored.
+    """
+    mask = 0
+    for format_name, legal in legalities.items():
+        if legal:
+            mask |= FORMAT_BITS.get(format_name, 0)
+    return mask
+
+
+@dataclass(slots=True)
 class VariantEntity(AggregateRoot[int]):
     """
     Domain entity representing a variant (specific combo instance).
@@ -82,14 +118,25 @@ class VariantEntity(AggregateRoot[int]):
     feature_produced_ids: List[int] = field(default_factory=list)
     combo_ids: List[int] = field(default_factory=list)
     
-    # Legality by format
-    legalities: Dict[str, bool] = field(default_factory=dict)
+    # Card count annotated by the repository (see with_card_count) so list
+    # queries need not load card_ids; None falls back to len(card_ids)
+    _card_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Legality by format, as FORMAT_BITS flags (see legal_mask_from)
+    legal_mask: int = 0
     
     # Price information
     price_tcgplayer: Optional[float] = None
     price_cardkingdom: Optional[float] = None
     price_cardmarket: Optional[float] = None
     
+    @classmethod
+    def with_card_count(cls, card_count: int, **kwargs) -> 'VariantEntity':
+        """Build a variant whose card count was preloaded by the repository."""
+        variant = cls(**kwargs)
+        variant._card_count = card_count
+        return variant
+    
     def validate(self) -> bool:
         """Validate variant entity state."""
         if not self.unique_id:
@@ -100,7 +147,7 @@ class VariantEntity(AggregateRoot[int]):
     
     def is_legal_in(self, format_name: str) -> bool:
         """Check if variant is legal in a specific format."""
-        return self.legalities.get(format_name, False)
+        return bool(self.legal_mask & FORMAT_BITS.get(format_name, 0))
     
     def is_budget_friendly(self, max_price: float = 50.0) -> bool:
         """Check if variant is budget-friendly based on TCGPlayer price."""
@@ -108,7 +155,20 @@ class VariantEntity(AggregateRoot[int]):
             return True  # Unknown price, assume budget-friendly
         return self.price_tcgplayer <= max_price
     
+    @property
+    def legal_formats(self) -> FrozenSet[str]:
+        """Get the set of formats the variant is legal in."""
+        return legal_formats_for(self.legal_mask)
+    
+    @property
+    def legalities(self) -> Dict[str, bool]:
+        """Get legality for every known format."""
+        mask = self.legal_mask
+        return {name: bool(mask & bit) for name, bit in FORMAT_BITS.items()}
+    
     @property
     def card_count(self) -> int:
         """Get total number of cards in the variant."""
+        if self._card_count is not None:
+            return self._card_count
         return len(self.card_ids)
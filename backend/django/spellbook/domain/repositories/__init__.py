@@ -9,7 +9,12 @@ from .card import CardRepository
 from .combo import ComboRepository
 from .variant import VariantRepository
 from .feature import FeatureRepository
-from .template import TemplateRepository
+from .template import (
+    TEMPLATE_CACHE_VERSION_KEY,
+    CachedTemplateRepository,
+    TemplateRepository,
+    bump_template_cache_version,
+)
 
 __all__ = [
     'CardRepository',
@@ -17,4 +22,7 @@ __all__ = [
     'VariantRepository',
     'FeatureRepository',
     'TemplateRepository',
+    'CachedTemplateRepository',
+    'TEMPLATE_CACHE_VERSION_KEY',
+    'bump_template_cache_version',
 ]
@@ -0,0 +1,67 @@
+"""
+Name search helpers for ORM-backed repositories.
+
+Shared by the Feature and Template repositories so every
+``search_by_name`` implementation runs the same index-backed query.
+"""
+
+from typing import Any, List
+
+
+def trigram_name_search(queryset: Any, query: str, limit: int, field: str = 'name') -> Any:
+    """
+    Fuzzy-match a Django queryset by name with pg_trgm.
+    
+    Candidates are pruned with the trigram ``%`` operator on ``UPPER(field)``,
+    which is served by the ``gin_trgm_ops`` indexes on the spellbook models,
+    then ranked by similarity in the same query.
+    
+    Args:
+        queryset: Queryset to search.
+        query: The search query string.
+        limit: Maximum number of results.
+        field: Name column to match against.
+        
+    Returns:
+        The ``limit`` most similar rows, best match first.
+    """
+    # Imported here so the domain layer does not depend on Django
+    from django.contrib.postgres.search import TrigramSimilarity
+    from django.db.models.functions import Upper
+    
+    query = query.upper()
+    return queryset.annotate(
+        _name_upper=Upper(field),
+        _similarity=TrigramSimilarity(Upper(field), query),
+    ).filter(
+        _name_upper__trigram_similar=query
+    ).order_by('-_similarity')[:limit]
+
+
+def name_search(queryset: Any, query: str, limit: int, field: str = 'name') -> List[Any]:
+    """
+    Search a Django queryset by name, trying a prefix match first.
+    
+    Search-as-you-type queries are usually exact prefixes, so rows whose
+    name starts with ``query`` are returned without any fuzzy scoring.
+    Only when they do not fill ``limit`` is the trigram search run for
+    the remaining slots.
+    
+    Args:
+        queryset: Queryset to search.
+        query: The search query string.
+        limit: Maximum number of results.
+        field: Name column to match against.
+        
+    Returns:
+        Prefix matches ordered by name, followed by fuzzy matches.
+    """
+    results = list(
+        queryset.filter(**{f'{field}__istartswith': query}).order_by(field)[:limit]
+    )
+    if len(results) < limit and query:
+        found = [row.pk for row in results]
+        results.extend(trigram_name_search(
+            queryset.exclude(pk__in=found), query, limit - len(results), field
+        ))
+    return results
@@ -5,7 +5,7 @@ Defines the data access contract for Card entities.
 """
 
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 # Import utilities ensure shared libs are available
 from .. import _imports  # noqa: F401
@@ -34,6 +34,28 @@ class CardRepository(Repository[CardEntity, int]):
         """
         pass
     
+    def get_ids_by_names(self, names: Sequence[str]) -> Dict[str, int]:
+        """
+        Resolve many exact card names to card IDs in one call.
+        
+        The default implementation falls back to one ``get_by_name`` call
+        per name. Database-backed implementations should override it with
+        a single ``SELECT id, name FROM cards WHERE name IN (...)`` query.
+        
+        Args:
+            names: The exact card names.
+            
+        Returns:
+            Mapping of name to card ID for every name that matched.
+            Unknown names are omitted.
+        """
+        ids: Dict[str, int] = {}
+        for name in names:
+            card = self.get_by_name(name)
+            if card and card.id:
+                ids[name] = card.id
+        return ids
+    
     @abstractmethod
     def get_by_oracle_id(self, oracle_id: str) -> Optional[CardEntity]:
         """
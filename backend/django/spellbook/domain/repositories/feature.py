@@ -5,7 +5,7 @@ Defines the data access contract for Feature entities.
 """
 
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 
 # Import utilities ensure shared libs are available
 from .. import _imports  # noqa: F401
@@ -39,6 +39,11 @@ class FeatureRepository(Repository[FeatureEntity, int]):
         """
         Search features by name using fuzzy matching.
         
+        Matching must run in the database against the name trigram index,
+        not by scoring rows in Python; ORM-backed implementations should
+        use ``_name_search.name_search``, which skips fuzzy scoring for
+        prefix matches.
+        
         Args:
             query: The search query string.
             limit: Maximum number of results.
@@ -63,6 +68,10 @@ class FeatureRepository(Repository[FeatureEntity, int]):
         """
         Get the most popular features by variant count.
         
+        Implementations must count and order in the database, never per
+        feature in Python; ORM-backed ones should build the query with
+        ``_popular_queryset``.
+        
         Args:
             limit: Maximum number of results.
             
@@ -70,3 +79,23 @@ class FeatureRepository(Repository[FeatureEntity, int]):
             List of popular features sorted by variant count.
         """
         pass
+    
+    @staticmethod
+    def _popular_queryset(queryset: Any, limit: int, relation: str = 'produced_by_variants') -> Any:
+        """
+        Annotate a Django feature queryset with its variant count and rank it.
+        
+        Args:
+            queryset: Feature queryset to rank.
+            limit: Maximum number of results.
+            relation: Reverse relation from features to variants.
+            
+        Returns:
+            The top ``limit`` features by ``variant_count``, in one query.
+        """
+        # Imported here so the domain layer does not depend on Django
+        from django.db.models import Count
+        
+        return queryset.annotate(
+            variant_count=Count(relation, distinct=True)
+        ).order_by('-variant_count')[:limit]
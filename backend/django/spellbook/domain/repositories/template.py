@@ -5,7 +5,7 @@ Defines the data access contract for Template entities.
 """
 
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 # Import utilities ensure shared libs are available
 from .. import _imports  # noqa: F401
@@ -39,6 +39,11 @@ class TemplateRepository(Repository[TemplateEntity, int]):
         """
         Search templates by name using fuzzy matching.
         
+        Matching must run in the database against the name trigram index,
+        not by scoring rows in Python; ORM-backed implementations should
+        use ``_name_search.name_search``, which skips fuzzy scoring for
+        prefix matches.
+        
         Args:
             query: The search query string.
             limit: Maximum number of results.
@@ -73,3 +78,110 @@ class TemplateRepository(Repository[TemplateEntity, int]):
             List of card IDs that satisfy the template.
         """
         pass
+
+
+# Cache key holding the current version of cached template lookups
+TEMPLATE_CACHE_VERSION_KEY = 'tpl:version'
+
+
+def bump_template_cache_version(cache: Any) -> None:
+    """
+    Atomically bump the template cache version.
+    
+    ``add`` only creates the key when it is missing, and ``incr`` is atomic
+    in the cache backend, so concurrent bumps are never lost.
+    """
+    cache.add(TEMPLATE_CACHE_VERSION_KEY, 0, None)
+    cache.incr(TEMPLATE_CACHE_VERSION_KEY)
+
+
+class CachedTemplateRepository(TemplateRepository):
+    """
+    Read-through cache around a TemplateRepository.
+    
+    ``get_templates_for_card`` and ``get_cards_for_template`` results are
+    cached (e.g. in the Redis-backed Django cache) under keys carrying a
+    version number. Writes through this repository bump the version, as do
+    the Template/TemplateReplacement signals in spellbook_app, so stale
+    entries are never read again and simply expire.
+    """
+    
+    CACHE_TTL = 3600
+    CACHE_VERSION_KEY = TEMPLATE_CACHE_VERSION_KEY
+    
+    def __init__(self, repository: TemplateRepository, cache: Any):
+        self._repository = repository
+        self._cache = cache  # Any object with Django cache get/set/add/incr
+    
+    def invalidate_cache(self) -> None:
+        """Invalidate all cached lookups by bumping the key version."""
+        bump_template_cache_version(self._cache)
+    
+    def _cached(self, key: str, load):
+        version = self._cache.get(self.CACHE_VERSION_KEY) or 0
+        key = f'{key}:v{version}'
+        value = self._cache.get(key)
+        if value is None:
+            value = load()
+            self._cache.set(key, value, self.CACHE_TTL)
+        return value
+    
+    def get_templates_for_card(self, card_id: int) -> List[TemplateEntity]:
+        return self._cached(
+            f'tpl:card:{card_id}',
+            lambda: self._repository.get_templates_for_card(card_id)
+        )
+    
+    def get_cards_for_template(self, template_id: int) -> List[int]:
+        return self._cached(
+            f'tpl:template:{template_id}',
+            lambda: self._repository.get_cards_for_template(template_id)
+        )
+    
+    # Everything else is delegated unchanged
+    
+    def get_by_name(self, name: str) -> Optional[TemplateEntity]:
+        return self._repository.get_by_name(name)
+    
+    def search_by_name(self, query: str, limit: int = 10) -> List[TemplateEntity]:
+        return self._repository.search_by_name(query, limit)
+    
+    def get_by_id(self, entity_id: int) -> Optional[TemplateEntity]:
+        return self._repository.get_by_id(entity_id)
+    
+    def get_many(self, entity_ids: Sequence[int]) -> Dict[int, TemplateEntity]:
+        return self._repository.get_many(entity_ids)
+    
+    def get_all(self, limit: Optional[int] = None, offset: int = 0) -> List[TemplateEntity]:
+        return self._repository.get_all(limit, offset)
+    
+    def count(self) -> int:
+        return self._repository.count()
+    
+    def exists(self, entity_id: int) -> bool:
+        return self._repository.exists(entity_id)
+    
+    def add(self, entity: TemplateEntity) -> TemplateEntity:
+        result = self._repository.add(entity)
+        self.invalidate_cache()
+        return result
+    
+    def update(self, entity: TemplateEntity) -> TemplateEntity:
+        result = self._repository.update(entity)
+        self.invalidate_cache()
+        return result
+    
+    def delete(self, entity_id: int) -> bool:
+        result = self._repository.delete(entity_id)
+        self.invalidate_cache()
+        return result
+    
+    def add_batch(self, entities: List[TemplateEntity]) -> List[TemplateEntity]:
+        result = self._repository.add_batch(entities)
+        self.invalidate_cache()
+        return result
+    
+    def delete_batch(self, entity_ids: List[int]) -> int:
+        result = self._repository.delete_batch(entity_ids)
+        self.invalidate_cache()
+        return result
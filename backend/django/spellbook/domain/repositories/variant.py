@@ -5,7 +5,7 @@ Defines the data access contract for Variant entities.
 """
 
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Any, Collection, Dict, Iterable, List, Optional, Sequence, Tuple
 
 # Import utilities ensure shared libs are available
 from .. import _imports  # noqa: F401
@@ -20,8 +20,25 @@ class VariantRepository(Repository[VariantEntity, int]):
     Repository interface for Variant aggregate.
     
     Extends the base Repository with Variant-specific query methods.
+    
+    List queries (``search_summaries``, ``get_all``) should load
+    only the SUMMARY_FIELDS columns and fetch related rows in bulk, never
+    lazily per variant. With the Django ORM: ``.only(...)``,
+    ``select_related`` for foreign keys and ``prefetch_related`` for the
+    card and legality relations (``Prefetch('cards', queryset=Card.objects.only('id'))``).
+    When only the number of cards is needed, annotate it instead
+    (``.annotate(card_count=Count('cards'))``) and build the entity with
+    ``VariantEntity.with_card_count`` rather than prefetching the cards.
     """
     
+    # Values of a variant search summary row, in VariantSummaryDTO field
+    # order; card_count is an annotation (Count('cards')), the rest are columns
+    SUMMARY_FIELDS = ('id', 'unique_id', 'name', 'identity', 'card_count', 'bracket', 'price_tcgplayer')
+    
+    # Above this many feature/card IDs, filter through a VALUES CTE or temp
+    # table (``IN (SELECT v FROM ids)``) instead of a literal IN list
+    MAX_IN_CLAUSE_IDS = 500
+    
     @abstractmethod
     def get_by_unique_id(self, unique_id: str) -> Optional[VariantEntity]:
         """
@@ -35,6 +52,31 @@ class VariantRepository(Repository[VariantEntity, int]):
         """
         pass
     
+    def get_by_unique_ids(self, unique_ids: Sequence[str]) -> Dict[str, VariantEntity]:
+        """
+        Get many variants by their unique string IDs in one call.
+        
+        The default implementation falls back to one ``get_by_unique_id``
+        call per ID. Database-backed implementations should override it
+        with a single ``filter(unique_id__in=...)`` query that also
+        prefetches the related cards and features
+        (``prefetch_related('uses', 'produces')``), so serializing the
+        result does not query per variant.
+        
+        Args:
+            unique_ids: The unique string identifiers.
+            
+        Returns:
+            Mapping of unique ID to variant for every ID that was found.
+            Unknown IDs are omitted.
+        """
+        variants: Dict[str, VariantEntity] = {}
+        for unique_id in unique_ids:
+            variant = self.get_by_unique_id(unique_id)
+            if variant is not None:
+                variants[unique_id] = variant
+        return variants
+    
     @abstractmethod
     def get_by_status(self, status: VariantStatus, limit: Optional[int] = None) -> List[VariantEntity]:
         """
@@ -76,13 +118,19 @@ class VariantRepository(Repository[VariantEntity, int]):
         pass
     
     @abstractmethod
-    def get_legal_variants(self, format_name: str, limit: Optional[int] = None) -> List[VariantEntity]:
+    def get_legal_variants(
+        self,
+        format_name: str,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None
+    ) -> List[VariantEntity]:
         """
         Get all variants legal in a specific format.
         
         Args:
             format_name: The format to check legality for.
             limit: Maximum number of results.
+            cursor: Only return variants with an ID greater than this, ordered by ID.
             
         Returns:
             List of legal variants.
@@ -90,23 +138,121 @@ class VariantRepository(Repository[VariantEntity, int]):
         pass
     
     @abstractmethod
-    def search_by_identity(self, identity: str) -> List[VariantEntity]:
+    def search_by_identity(
+        self,
+        identity: str,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None
+    ) -> List[VariantEntity]:
         """
         Search variants by color identity.
         
         Args:
             identity: The color identity string (e.g., "WUB").
+            limit: Maximum number of results.
+            cursor: Only return variants with an ID greater than this, ordered by ID.
             
         Returns:
             List of variants matching the identity.
         """
         pass
     
+    @abstractmethod
+    def search_summaries(
+        self,
+        *,
+        identity: Optional[str] = None,
+        format_name: Optional[str] = None,
+        feature_ids: Optional[Collection[int]] = None,
+        card_ids: Optional[Collection[int]] = None,
+        min_cards: Optional[int] = None,
+        max_cards: Optional[int] = None,
+        max_price: Optional[float] = None,
+        include_spoilers: bool = False,
+        text_query: Optional[str] = None,
+        limit: int,
+        cursor: Optional[int] = None,
+        offset: int = 0
+    ) -> Iterable[Tuple[Any, ...]]:
+        """
+        Search variants with every filter applied in a single query,
+        returning summary rows instead of entities.
+        
+        Implementations must push all filters down to the data store
+        rather than filtering in Python, e.g. with Django:
+        ``.filter(identity=...)``, ``.filter(legalities__format=..., legalities__legal=True)``,
+        ``.filter(features__in=...)``, ``.annotate(Count('cards'))`` for the
+        card count bounds, ``.filter(price_tcgplayer__lte=...)`` and
+        ``.exclude(spoiler=True)`` unless spoilers are included. Project the
+        values directly without instantiating models or entities
+        (``.values_list(*SUMMARY_FIELDS)``); rows may be streamed lazily
+        (``.iterator()``).
+        
+        ``feature_ids`` and ``card_ids`` arrive deduplicated; when either
+        holds more than MAX_IN_CLAUSE_IDS IDs, join against a VALUES CTE
+        rather than emitting one huge IN list.
+        
+        Args:
+            identity: Color identity to match (e.g., "WUB").
+            format_name: Format the variants must be legal in.
+            feature_ids: Features the variants must produce.
+            card_ids: Cards the variants must contain.
+            min_cards: Minimum number of cards in the variant.
+            max_cards: Maximum number of cards in the variant.
+            max_price: Maximum TCGPlayer price.
+            include_spoilers: Whether to include spoiler variants.
+            text_query: Free-text query on the variant name and description.
+            limit: Maximum number of results.
+            cursor: Only return variants with an ID greater than this.
+            offset: Number of results to skip (legacy offset pagination).
+            
+        Returns:
+            Iterable of tuples holding the SUMMARY_FIELDS values in that
+            order, ordered by ascending ID.
+        """
+        pass
+    
+    @abstractmethod
+    def search_count(
+        self,
+        *,
+        identity: Optional[str] = None,
+        format_name: Optional[str] = None,
+        feature_ids: Optional[Collection[int]] = None,
+        card_ids: Optional[Collection[int]] = None,
+        min_cards: Optional[int] = None,
+        max_cards: Optional[int] = None,
+        max_price: Optional[float] = None,
+        include_spoilers: bool = False,
+        text_query: Optional[str] = None
+    ) -> int:
+        """
+        Count the variants matching a search.
+        
+        Filters are applied exactly as in ``search_summaries``, pushed down
+        to a single ``COUNT`` query.
+        
+        Args:
+            Same filters as ``search_summaries``.
+            
+        Returns:
+            Number of matching variants.
+        """
+        pass
+    
     @abstractmethod
     def find_by_cards(self, card_ids: List[int]) -> List[VariantEntity]:
         """
         Find variants that can be built with the given cards.
         
+        Implementations must resolve containment in a single query rather
+        than testing variants one by one. With Postgres, either filter an
+        indexed ``card_ids int[]`` column (``card_ids__contained_by=card_ids``,
+        backed by ``CREATE INDEX ... USING GIN (card_ids)``) or count the
+        cards outside the set through the join
+        (``.annotate(missing=Count('cards', filter=~Q(cards__in=card_ids))).filter(missing=0)``),
+        then ``prefetch_related`` the card and feature relations.
+        
         Args:
             card_ids: List of available card IDs.
             
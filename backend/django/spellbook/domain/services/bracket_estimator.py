@@ -6,7 +6,7 @@ Provides domain logic for estimating deck power level brackets.
 
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import AbstractSet, Iterable, List, Mapping, Optional
 
 # Import utilities ensure shared libs are available
 from .. import _imports  # noqa: F401
@@ -14,14 +14,14 @@ from .. import _imports  # noqa: F401
 from ddd.services import DomainService
 
 
-@dataclass
+@dataclass(slots=True)
 class BracketEstimateRequest:
     """Request for bracket estimation."""
     card_names: List[str]
     commander_names: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BracketBreakdown:
     """Breakdown of bracket contribution factors."""
     mass_land_denial_count: int = 0
@@ -31,7 +31,7 @@ class BracketBreakdown:
     combo_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BracketEstimateResult:
     """Result of bracket estimation."""
     bracket: int
@@ -67,6 +67,9 @@ class BracketEstimatorService(DomainService):
         """
         Get the individual factors contributing to bracket estimation.
         
+        Implementations should load their factor card sets once and
+        count with ``_count_factors`` rather than probing card by card.
+        
         Args:
             card_names: List of card names in the deck.
             
@@ -75,8 +78,30 @@ class BracketEstimatorService(DomainService):
         """
         pass
     
-    def execute(self, *args, **kwargs):
+    @staticmethod
+    def _count_factors(
+        card_names: Iterable[str],
+        factor_cards: Mapping[str, AbstractSet[str]]
+    ) -> BracketBreakdown:
+        """
+        Count the deck cards in each factor set with one set intersection each.
+        
+        Args:
+            card_names: Card names in the deck.
+            factor_cards: Card names per BracketBreakdown field,
+                e.g. ``{'tutor_count': tutors, 'fast_mana_count': fast_mana}``.
+                
+        Returns:
+            Breakdown with a count for every given factor.
+        """
+        deck = frozenset(card_names)
+        return BracketBreakdown(**{
+            factor: len(deck.intersection(cards))
+            for factor, cards in factor_cards.items()
+        })
+    
+    def execute(self, request: Optional[BracketEstimateRequest] = None) -> Optional[BracketEstimateResult]:
         """Execute the bracket estimator service."""
-        if 'request' in kwargs:
-            return self.estimate_bracket(kwargs['request'])
+        if request is not None:
+            return self.estimate_bracket(request)
         return None
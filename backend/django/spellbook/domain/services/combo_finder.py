@@ -15,7 +15,7 @@ from ddd.services import DomainService
 from ..entities import VariantEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class ComboSearchCriteria:
     """Criteria for searching combos."""
     card_ids: List[int]
@@ -26,7 +26,7 @@ class ComboSearchCriteria:
     include_spoilers: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ComboSearchResult:
     """Result of a combo search."""
     variants: List[VariantEntity]
@@ -74,8 +74,8 @@ class ComboFinderService(DomainService):
         """
         pass
     
-    def execute(self, *args, **kwargs):
+    def execute(self, criteria: Optional[ComboSearchCriteria] = None) -> Optional[ComboSearchResult]:
         """Execute the combo finder service."""
-        if 'criteria' in kwargs:
-            return self.find_combos(kwargs['criteria'])
+        if criteria is not None:
+            return self.find_combos(criteria)
         return None
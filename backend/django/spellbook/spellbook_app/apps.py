@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class SpellbookConfig(AppConfig):
+    name = 'spellbook'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,13 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from domain.repositories.template import bump_template_cache_version
+from .models import Template, TemplateReplacement
+
+
+@receiver(post_save, sender=Template, dispatch_uid='invalidate_template_cache')
+@receiver(post_delete, sender=Template, dispatch_uid='invalidate_template_cache_on_delete')
+@receiver(post_save, sender=TemplateReplacement, dispatch_uid='invalidate_template_replacement_cache')
+@receiver(post_delete, sender=TemplateReplacement, dispatch_uid='invalidate_template_replacement_cache_on_delete')
+def invalidate_template_cache(sender, **kwargs):
+    bump_template_cache_version(cache)
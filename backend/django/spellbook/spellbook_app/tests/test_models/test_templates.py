@@ -1,7 +1,9 @@
+from django.core.cache import cache
 from spellbook.tests.testing import SpellbookTestCaseWithSeeding
 from common.inspection import count_methods
 from spellbook.models import Card, Template
 from spellbook.models.scryfall import SCRYFALL_API_ROOT, SCRYFALL_WEBSITE_CARD_SEARCH
+from domain.repositories.template import TEMPLATE_CACHE_VERSION_KEY
 
 
 class TemplateTests(SpellbookTestCaseWithSeeding):
@@ -44,5 +46,13 @@ class TemplateTests(SpellbookTestCaseWithSeeding):
         t.replacements.add(Card.objects.get(id=self.c4_id))
         self.assertEqual(t.replacements.count(), 2)
 
+    def test_cache_version_bumped_on_save_and_delete(self):
+        before = cache.get(TEMPLATE_CACHE_VERSION_KEY) or 0
+        t = Template.objects.create(name='TX', scryfall_query='tou>5', description='cache test')
+        after_save = cache.get(TEMPLATE_CACHE_VERSION_KEY)
+        self.assertGreater(after_save, before)
+        t.delete()
+        self.assertGreater(cache.get(TEMPLATE_CACHE_VERSION_KEY), after_save)
+
     def test_method_count(self):
         self.assertEqual(count_methods(Template), 4)
@@ -17,21 +17,21 @@ class SpellbookRouter:
         To migrate a model, add its lowercase name to the appropriate set:
         
         # Fully migrated - reads and writes from new database
-        MIGRATED_MODELS = {'card', 'feature'}
+        MIGRATED_MODELS = frozenset({'card', 'feature'})
         
         # Being migrated - writes to both, reads from new
-        MIGRATING_MODELS = {'combo', 'variant'}
+        MIGRATING_MODELS = frozenset({'combo', 'variant'})
         
         # Not listed - defaults to new database
     """
     
     # Models that have been fully migrated to the new system
-    # Example: {'card', 'feature', 'template'}
-    MIGRATED_MODELS: set = set()
+    # Example: frozenset({'card', 'feature', 'template'})
+    MIGRATED_MODELS: frozenset = frozenset()
     
     # Models being migrated (dual-write phase)
-    # Example: {'combo', 'variant'}
-    MIGRATING_MODELS: set = set()
+    # Example: frozenset({'combo', 'variant'})
+    MIGRATING_MODELS: frozenset = frozenset()
     
     def db_for_read(self, model, **hints):
         """
@@ -40,6 +40,10 @@ class SpellbookRouter:
         Fully migrated models read from default database.
         Legacy models read from legacy database.
         """
+        if not (self.MIGRATED_MODELS or self.MIGRATING_MODELS):
+            # Nothing to route yet; skip the model name lookup
+            return 'default'
+        
         model_name = model._meta.model_name
         
         if model_name in self.MIGRATED_MODELS:
@@ -60,17 +64,10 @@ class SpellbookRouter:
         """
         return 'default'
     
-    def allow_relation(self, obj1, obj2, **hints):
-        """
-        Allow relations between objects in the same database.
-        """
-        return True
+    # Allow relations between objects in the same database
+    allow_relation = staticmethod(lambda *args, **hints: True)
     
-    def allow_migrate(self, db, app_label, model_name=None, **hints):
-        """
-        Control which database migrations run on.
-        """
-        if db == 'legacy':
-            # Don't run migrations on legacy database
-            return False
-        return True
+    # Migrations never run on the legacy database
+    allow_migrate = staticmethod(
+        lambda db, app_label, model_name=None, **hints: db != 'legacy'
+    )
@@ -5,11 +5,16 @@ Provides API endpoints following the strangler fig pattern,
 allowing gradual migration from the legacy Commander Spellbook backend.
 """
 
+import logging
+
+import orjson
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from rest_framework.routers import DefaultRouter
 
+logger = logging.getLogger(__name__)
+
 # DAPR subscription configuration for event-driven architecture
 DAPR_SUBSCRIPTIONS = [
     {
@@ -32,83 +37,90 @@ DAPR_SUBSCRIPTIONS = [
     }
 ]
 
+# The subscriptions never change, so serialize them once
+_DAPR_SUBSCRIPTIONS_BODY = orjson.dumps(DAPR_SUBSCRIPTIONS)
+_SUCCESS_BODY = orjson.dumps({"success": True})
+
 
 def dapr_subscribe(request):
     """DAPR subscription endpoint."""
-    return JsonResponse(DAPR_SUBSCRIPTIONS, safe=False)
+    return HttpResponse(_DAPR_SUBSCRIPTIONS_BODY, content_type='application/json')
 
 
 def handle_card_updated(request):
     """Handle spellbook card updated events."""
-    import json
     if request.method == 'POST':
-        event = json.loads(request.body)
+        event = orjson.loads(request.body)
         data = event.get("data", event)
-        print(f"[Spellbook] Card updated event: {data}")
-        return JsonResponse({"success": True})
+        logger.debug("Card updated event: %s", data)
+        return HttpResponse(_SUCCESS_BODY, content_type='application/json')
     return JsonResponse({"error": "Method not allowed"}, status=405)
 
 
 def handle_variant_created(request):
     """Handle spellbook variant created events."""
-    import json
     if request.method == 'POST':
-        event = json.loads(request.body)
+        event = orjson.loads(request.body)
         data = event.get("data", event)
-        print(f"[Spellbook] Variant created event: {data}")
-        return JsonResponse({"success": True})
+        logger.debug("Variant created event: %s", data)
+        return HttpResponse(_SUCCESS_BODY, content_type='application/json')
     return JsonResponse({"error": "Method not allowed"}, status=405)
 
 
 def handle_combo_validated(request):
     """Handle spellbook combo validated events."""
-    import json
     if request.method == 'POST':
-        event = json.loads(request.body)
+        event = orjson.loads(request.body)
         data = event.get("data", event)
-        print(f"[Spellbook] Combo validated event: {data}")
-        return JsonResponse({"success": True})
+        logger.debug("Combo validated event: %s", data)
+        return HttpResponse(_SUCCESS_BODY, content_type='application/json')
     return JsonResponse({"error": "Method not allowed"}, status=405)
 
 
+# Static bodies for the health and info endpoints, serialized once
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "django-spellbook",
+    "dapr": "enabled",
+    "pattern": "strangler-fig"
+})
+
+_API_INFO_BODY = orjson.dumps({
+    "service": "django-spellbook",
+    "version": "0.1.0",
+    "description": "Commander Spellbook API - Strangler Fig Integration",
+    "dapr": {
+        "enabled": True,
+        "state_store": "statestore-spellbook",
+        "pubsub": "pubsub",
+    },
+    "ddd_compliance": {
+        "bounded_contexts": True,
+        "aggregate_roots": ["Card", "Combo", "Variant", "Feature", "Template"],
+        "repository_pattern": True,
+        "domain_services": True,
+        "application_services": True,
+        "strangler_fig_pattern": True,
+    },
+    "endpoints": {
+        "variants": "/api/v1/variants/",
+        "cards": "/api/v1/cards/",
+        "features": "/api/v1/features/",
+        "templates": "/api/v1/templates/",
+        "find_my_combos": "/api/v1/find-my-combos/",
+        "estimate_bracket": "/api/v1/estimate-bracket/",
+    }
+})
+
+
 def health_check(request):
     """Health check endpoint."""
-    return JsonResponse({
-        "status": "healthy",
-        "service": "django-spellbook",
-        "dapr": "enabled",
-        "pattern": "strangler-fig"
-    })
+    return HttpResponse(_HEALTH_BODY, content_type='application/json')
 
 
 def api_info(request):
     """API information endpoint."""
-    return JsonResponse({
-        "service": "django-spellbook",
-        "version": "0.1.0",
-        "description": "Commander Spellbook API - Strangler Fig Integration",
-        "dapr": {
-            "enabled": True,
-            "state_store": "statestore-spellbook",
-            "pubsub": "pubsub",
-        },
-        "ddd_compliance": {
-            "bounded_contexts": True,
-            "aggregate_roots": ["Card", "Combo", "Variant", "Feature", "Template"],
-            "repository_pattern": True,
-            "domain_services": True,
-            "application_services": True,
-            "strangler_fig_pattern": True,
-        },
-        "endpoints": {
-            "variants": "/api/v1/variants/",
-            "cards": "/api/v1/cards/",
-            "features": "/api/v1/features/",
-            "templates": "/api/v1/templates/",
-            "find_my_combos": "/api/v1/find-my-combos/",
-            "estimate_bracket": "/api/v1/estimate-bracket/",
-        }
-    })
+    return HttpResponse(_API_INFO_BODY, content_type='application/json')
 
 
 # API Router
@@ -4,36 +4,113 @@ Provides the foundation for creating MCP-compatible servers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import json
+import re
+import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@dataclass(slots=True)
 class MCPTool:
     """Definition of an MCP tool."""
     name: str
     description: str
     input_schema: Dict[str, Any]
     handler: Callable
+    # Listing entry, built once when the tool is defined
+    view: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.view = {
+            "name": self.name,
+            "description": self.description,
+            "inputSchema": self.input_schema,
+        }
+
+
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_]\w*)\}")
+
+
+class _KeepMissing(dict):
+    """format_map arguments that leave unknown placeholders as written."""
+    
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
 
 
-@dataclass
+def _compile_template(template: str) -> Optional[str]:
+    """
+    Turn a ``{name}`` prompt template into a ``str.format_map`` string.
+    
+    Every other brace is escaped so it renders literally. Returns None
+    for templates without placeholders, which render as-is.
+    """
+    if not _PLACEHOLDER.search(template):
+        return None
+    parts = []
+    last = 0
+    for match in _PLACEHOLDER.finditer(template):
+        literal = template[last:match.start()]
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        parts.append(match.group(0))
+        last = match.end()
+    parts.append(template[last:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
 class MCPPrompt:
     """Definition of an MCP prompt template."""
     name: str
     description: str
     template: str
-    arguments: List[str] = field(default_factory=list)
+    arguments: Tuple[str, ...] = ()
+    compiled_template: Optional[str] = field(init=False, repr=False, compare=False)
+    # Listing entry, built once when the prompt is defined
+    view: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Accept any sequence of argument names
+        if not isinstance(self.arguments, tuple):
+            object.__setattr__(self, "arguments", tuple(self.arguments))
+        object.__setattr__(self, "compiled_template", _compile_template(self.template))
+        object.__setattr__(self, "view", {
+            "name": self.name,
+            "description": self.description,
+            "arguments": self.arguments,
+        })
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCPResource:
     """Definition of an MCP resource."""
     uri: str
     name: str
     description: str
     mime_type: str = "application/json"
+    # Listing entry, built once when the resource is defined
+    view: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "view", {
+            "uri": self.uri,
+            "name": self.name,
+            "description": self.description,
+            "mimeType": self.mime_type,
+        })
 
 
 class MCPServer(ABC):
@@ -45,80 +122,99 @@ class MCPServer(ABC):
         self._tools: Dict[str, MCPTool] = {}
         self._prompts: Dict[str, MCPPrompt] = {}
         self._resources: Dict[str, MCPResource] = {}
+        # Listings are rebuilt only after a registration changes them
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._prompts_cache: Optional[List[Dict[str, Any]]] = None
+        self._resources_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_json: Optional[bytes] = None
+        self._prompts_json: Optional[bytes] = None
+        self._resources_json: Optional[bytes] = None
     
     def tool(self, name: Optional[str] = None, description: str = "", input_schema: Optional[Dict] = None):
         """Decorator to register a tool."""
         def decorator(func: Callable):
-            tool_name = name or func.__name__
+            # Interned so dispatch lookups can match keys by identity
+            tool_name = sys.intern(name or func.__name__)
             self._tools[tool_name] = MCPTool(
                 name=tool_name,
                 description=description or func.__doc__ or "",
                 input_schema=input_schema or {},
                 handler=func,
             )
+            self._tools_cache = None
+            self._tools_json = None
             return func
         return decorator
     
     def register_prompt(self, prompt: MCPPrompt) -> None:
         """Register a prompt template."""
-        self._prompts[prompt.name] = prompt
+        self._prompts[sys.intern(prompt.name)] = prompt
+        self._prompts_cache = None
+        self._prompts_json = None
     
     def register_resource(self, resource: MCPResource) -> None:
         """Register a resource."""
-        self._resources[resource.uri] = resource
+        self._resources[sys.intern(resource.uri)] = resource
+        self._resources_cache = None
+        self._resources_json = None
     
     def list_tools(self) -> List[Dict[str, Any]]:
-        """List all registered tools."""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.input_schema,
-            }
-            for tool in self._tools.values()
-        ]
+        """List all registered tools (shared cached list, do not mutate)."""
+        if self._tools_cache is not None:
+            return self._tools_cache
+        self._tools_cache = [tool.view for tool in self._tools.values()]
+        return self._tools_cache
     
     def list_prompts(self) -> List[Dict[str, Any]]:
-        """List all registered prompts."""
-        return [
-            {
-                "name": prompt.name,
-                "description": prompt.description,
-                "arguments": prompt.arguments,
-            }
-            for prompt in self._prompts.values()
-        ]
+        """List all registered prompts (shared cached list, do not mutate)."""
+        if self._prompts_cache is not None:
+            return self._prompts_cache
+        self._prompts_cache = [prompt.view for prompt in self._prompts.values()]
+        return self._prompts_cache
     
     def list_resources(self) -> List[Dict[str, Any]]:
-        """List all registered resources."""
-        return [
-            {
-                "uri": resource.uri,
-                "name": resource.name,
-                "description": resource.description,
-                "mimeType": resource.mime_type,
-            }
-            for resource in self._resources.values()
-        ]
+        """List all registered resources (shared cached list, do not mutate)."""
+        if self._resources_cache is not None:
+            return self._resources_cache
+        self._resources_cache = [resource.view for resource in self._resources.values()]
+        return self._resources_cache
+    
+    def list_tools_bytes(self) -> bytes:
+        """List all registered tools as JSON bytes, serialized once per change."""
+        if self._tools_json is None:
+            self._tools_json = _dumps(self.list_tools())
+        return self._tools_json
+    
+    def list_prompts_bytes(self) -> bytes:
+        """List all registered prompts as JSON bytes, serialized once per change."""
+        if self._prompts_json is None:
+            self._prompts_json = _dumps(self.list_prompts())
+        return self._prompts_json
+    
+    def list_resources_bytes(self) -> bytes:
+        """List all registered resources as JSON bytes, serialized once per change."""
+        if self._resources_json is None:
+            self._resources_json = _dumps(self.list_resources())
+        return self._resources_json
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
         """Execute a registered tool."""
-        if name not in self._tools:
+        tool = self._tools.get(name)
+        if tool is None:
             raise ValueError(f"Tool '{name}' not found")
         
-        tool = self._tools[name]
         return await tool.handler(**arguments)
     
     def get_prompt(self, name: str, arguments: Dict[str, str]) -> str:
         """Get a rendered prompt template."""
-        if name not in self._prompts:
+        prompt = self._prompts.get(name)
+        if prompt is None:
             raise ValueError(f"Prompt '{name}' not found")
         
-        prompt = self._prompts[name]
-        rendered = prompt.template
-        for arg_name, arg_value in arguments.items():
-            rendered = rendered.replace(f"{{{arg_name}}}", arg_value)
-        return rendered
+        compiled = prompt.compiled_template
+        if compiled is None:
+            return prompt.template
+        return compiled.format_map(_KeepMissing(arguments))
     
     @abstractmethod
     async def run(self, host: str = "localhost", port: int = 9000) -> None:
@@ -20,7 +20,24 @@ including VM file management.
 
 import json
 import logging
+import mmap
 import os
+import tempfile
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Errors raised for malformed VMs files, by whichever parser is in use
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if HAS_IJSON else (json.JSONDecodeError,)
 
 log = logging.getLogger(__name__)
 
@@ -34,6 +51,100 @@ def __virtual__():
     return __virtualname__
 
 
+def _loads(data):
+    """Parse JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj, indent=False):
+    """Serialize to compact (or 2-space indented) JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _is_blank(f):
+    """Check whether an open binary file holds only whitespace, then rewind it."""
+    while True:
+        chunk = f.read(65536)
+        if not chunk:
+            return True
+        if chunk.strip():
+            f.seek(0)
+            return False
+
+
+def _json_token(value):
+    """Get the bytes a string value is written as in JSON, or None if they may vary."""
+    if not isinstance(value, str) or not value.isascii():
+        return None
+    return json.dumps(value).encode()
+
+
+def _may_contain_vm(f, vm_hostname, vm_role):
+    """
+    Cheaply check whether an open VMs file could hold a VM entry.
+    
+    Searches the raw bytes for the JSON-encoded hostname and role without
+    parsing anything. False means the VM is certainly not in the file.
+    """
+    needles = (_json_token(vm_hostname), _json_token(vm_role))
+    if None in needles:
+        return True
+    if not os.fstat(f.fileno()).st_size:
+        return False
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return all(mm.find(needle) != -1 for needle in needles)
+
+
+def _read_vms(f):
+    """
+    Iterate over the VM entries of an open hypervisorVMs file.
+    
+    With ijson the entries are parsed incrementally, one at a time,
+    instead of loading the whole document first. Otherwise orjson parses
+    the memory-mapped file directly, without first reading it into a
+    bytes copy.
+    """
+    if _is_blank(f):
+        return iter(())
+    if HAS_IJSON:
+        return ijson.items(f, 'item', use_float=True)
+    if HAS_ORJSON:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return iter(orjson.loads(view))
+    return iter(_loads(f.read()))
+
+
+def _write_atomic(path, data, uid, gid):
+    """
+    Replace a file's contents atomically.
+    
+    The data is written to a temporary file in the same directory, given the
+    original file's mode and the requested ownership, synced, then renamed over
+    the original, so readers only ever see the old or the new contents.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.vms.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            os.fchmod(fd, os.stat(path).st_mode & 0o7777)
+            os.fchown(fd, uid, gid)
+            f.write(data)
+            f.flush()
+            os.fsync(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def remove_vm_from_vms_file(vms_file_path, vm_hostname, vm_role):
     """
     Remove a VM entry from the hypervisorVMs file.
@@ -56,22 +167,25 @@ def remove_vm_from_vms_file(vms_file_path, vm_hostname, vm_role):
             log.error(msg)
             return {'result': False, 'comment': msg}
         
-        # Read current VMs
-        with open(vms_file_path, 'r') as f:
-            content = f.read().strip()
-            vms = json.loads(content) if content else []
-        
-        # Find and remove the VM entry
-        original_count = len(vms)
-        vms = [vm for vm in vms if not (vm.get('hostname') == vm_hostname and vm.get('role') == vm_role)]
+        # Read current VMs, dropping the VM entry as they stream in
+        found = False
+        vms = []
+        with open(vms_file_path, 'rb') as f:
+            # Skip parsing entirely when the VM cannot be in the file
+            if _may_contain_vm(f, vm_hostname, vm_role):
+                entries = _read_vms(f)
+                for vm in entries:
+                    if vm.get('hostname') == vm_hostname and vm.get('role') == vm_role:
+                        # Hostname and role are unique, so keep the rest unchecked
+                        found = True
+                        vms.extend(entries)
+                        break
+                    vms.append(vm)
         
-        if len(vms) < original_count:
-            # VM was found and removed, write back to file
-            with open(vms_file_path, 'w') as f:
-                json.dump(vms, f, indent=2)
-            
-            # Set socore:socore ownership (939:939)
-            os.chown(vms_file_path, 939, 939)
+        if found:
+            # VM was found and removed, write back to file with
+            # socore:socore ownership (939:939)
+            _write_atomic(vms_file_path, _dumps(vms), 939, 939)
             
             msg = f"Removed VM {vm_hostname}_{vm_role} from {vms_file_path}"
             log.info(msg)
@@ -81,7 +195,7 @@ def remove_vm_from_vms_file(vms_file_path, vm_hostname, vm_role):
             log.warning(msg)
             return {'result': False, 'comment': msg}
             
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         msg = f"Failed to parse JSON in {vms_file_path}: {str(e)}"
         log.error(msg)
         return {'result': False, 'comment': msg}
@@ -89,3 +203,46 @@ def remove_vm_from_vms_file(vms_file_path, vm_hostname, vm_role):
         msg = f"Failed to remove VM {vm_hostname}_{vm_role} from {vms_file_path}: {str(e)}"
         log.error(msg)
         return {'result': False, 'comment': msg}
+
+
+def format_vms_file(vms_file_path):
+    """
+    Rewrite a hypervisorVMs file as indented JSON for reading.
+    
+    VMs files are written compactly; use this to pretty-print one on demand.
+    The next change made through this module writes it compactly again.
+    
+    Args:
+        vms_file_path (str): Path to the hypervisorVMs file
+        
+    Returns:
+        dict: Result dictionary with success status and message
+        
+    CLI Example:
+        salt '*' hypervisor.format_vms_file /opt/so/saltstack/local/salt/hypervisor/hosts/hypervisor1VMs
+    """
+    try:
+        # Check if file exists
+        if not os.path.exists(vms_file_path):
+            msg = f"VMs file not found: {vms_file_path}"
+            log.error(msg)
+            return {'result': False, 'comment': msg}
+        
+        with open(vms_file_path, 'rb') as f:
+            vms = list(_read_vms(f))
+        
+        # Set socore:socore ownership (939:939)
+        _write_atomic(vms_file_path, _dumps(vms, indent=True), 939, 939)
+        
+        msg = f"Formatted {vms_file_path}"
+        log.info(msg)
+        return {'result': True, 'comment': msg}
+            
+    except _JSON_ERRORS as e:
+        msg = f"Failed to parse JSON in {vms_file_path}: {str(e)}"
+        log.error(msg)
+        return {'result': False, 'comment': msg}
+    except Exception as e:
+        msg = f"Failed to format {vms_file_path}: {str(e)}"
+        log.error(msg)
+        return {'result': False, 'comment': msg}
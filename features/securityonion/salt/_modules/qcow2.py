@@ -20,17 +20,90 @@ This module is intended to work with Security Onion's virtualization infrastruct
 used in conjunction with salt-cloud for VM provisioning and management.
 """
 
+import collections
 import logging
 import subprocess
 import shlex
+import threading
 
 log = logging.getLogger(__name__)
 
 __virtualname__ = 'qcow2'
 
+# Number of trailing output lines kept for the returned stdout/stderr
+OUTPUT_TAIL_LINES = 200
+
 def __virtual__():
     return __virtualname__
 
+class _Quoted:
+    '''
+    Shell-quoted rendering of a command, built only if a log record is emitted.
+    '''
+    __slots__ = ('cmd',)
+
+    def __init__(self, cmd):
+        self.cmd = cmd
+
+    def __str__(self):
+        return ' '.join(shlex.quote(arg) for arg in self.cmd)
+
+def _stream_lines(pipe, stream, tail):
+    '''
+    Log each line of a script's output as it arrives, keeping only the last lines.
+    '''
+    with pipe:
+        for raw in pipe:
+            line = raw.decode(errors='replace')
+            log.info('qcow2 module: [%s] %s', stream, line.rstrip())
+            tail.append(line)
+
+def _positive_int_arg(value, name):
+    '''
+    Validate a positive integer parameter and return it as a command argument.
+    '''
+    if not isinstance(value, int) or value <= 0:
+        raise ValueError('{} must be a positive integer.'.format(name))
+    return str(value)
+
+def _run_script(cmd):
+    '''
+    Run a Security Onion script and collect its exit code and output.
+
+    The script is started with close_fds=False and an absolute path so that
+    subprocess can launch it through posix_spawn instead of fork+exec.
+    Descriptors opened by Python are non-inheritable, so none leak to the child.
+
+    Output is logged line by line while the script runs rather than buffered
+    until it exits; only the last OUTPUT_TAIL_LINES lines of each stream are
+    kept for the returned stdout and stderr.
+    '''
+    log.info('qcow2 module: Executing command: %s', _Quoted(cmd))
+
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False)
+        stdout = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+        # Drain stderr on a second thread so neither pipe can fill up and block the script
+        stderr_reader = threading.Thread(target=_stream_lines, args=(proc.stderr, 'stderr', stderr), daemon=True)
+        stderr_reader.start()
+        _stream_lines(proc.stdout, 'stdout', stdout)
+        stderr_reader.join()
+        proc.wait()
+        ret = {
+            'retcode': proc.returncode,
+            'stdout': ''.join(stdout),
+            'stderr': ''.join(stderr)
+        }
+        if proc.returncode != 0:
+            log.error('qcow2 module: Script execution failed with return code {}: {}'.format(proc.returncode, ret['stderr']))
+        else:
+            log.info('qcow2 module: Script executed successfully.')
+        return ret
+    except Exception as e:
+        log.error('qcow2 module: An error occurred while executing the script: {}'.format(e))
+        raise
+
 def modify_network_config(image, interface, mode, vm_name, ip4=None, gw4=None, dns4=None, search4=None):
     '''
     Usage:
@@ -114,23 +187,7 @@ def modify_network_config(image, interface, mode, vm_name, ip4=None, gw4=None, d
     else:
         raise ValueError("Invalid mode '{}'. Expected 'dhcp4' or 'static4'.".format(mode))
 
-    log.info('qcow2 module: Executing command: {}'.format(' '.join(shlex.quote(arg) for arg in cmd)))
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        ret = {
-            'retcode': result.returncode,
-            'stdout': result.stdout,
-            'stderr': result.stderr
-        }
-        if result.returncode != 0:
-            log.error('qcow2 module: Script execution failed with return code {}: {}'.format(result.returncode, result.stderr))
-        else:
-            log.info('qcow2 module: Script executed successfully.')
-        return ret
-    except Exception as e:
-        log.error('qcow2 module: An error occurred while executing the script: {}'.format(e))
-        raise
+    return _run_script(cmd)
 
 def modify_hardware_config(vm_name, cpu=None, memory=None, pci=None, start=False):
     '''
@@ -205,47 +262,24 @@ def modify_hardware_config(vm_name, cpu=None, memory=None, pci=None, start=False
     cmd = ['/usr/sbin/so-kvm-modify-hardware', '-v', vm_name]
 
     if cpu is not None:
-        if isinstance(cpu, int) and cpu > 0:
-            cmd.extend(['-c', str(cpu)])
-        else:
-            raise ValueError('cpu must be a positive integer.')
+        cmd.extend(['-c', _positive_int_arg(cpu, 'cpu')])
     if memory is not None:
-        if isinstance(memory, int) and memory > 0:
-            cmd.extend(['-m', str(memory)])
-        else:
-            raise ValueError('memory must be a positive integer.')
+        cmd.extend(['-m', _positive_int_arg(memory, 'memory')])
     if pci:
         # Handle PCI IDs (can be a single device or comma-separated list)
         if isinstance(pci, str):
-            devices = [dev.strip() for dev in pci.split(',') if dev.strip()]
+            devices = [dev for dev in (dev.strip() for dev in pci.split(',')) if dev]
         elif isinstance(pci, list):
             devices = pci
         else:
             devices = [pci]
 
         # Add each device with its own -p flag
-        for device in devices:
-            cmd.extend(['-p', str(device)])
+        cmd += [arg for device in devices for arg in ('-p', device if isinstance(device, str) else str(device))]
     if start:
         cmd.append('-s')
 
-    log.info('qcow2 module: Executing command: {}'.format(' '.join(shlex.quote(arg) for arg in cmd)))
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        ret = {
-            'retcode': result.returncode,
-            'stdout': result.stdout,
-            'stderr': result.stderr
-        }
-        if result.returncode != 0:
-            log.error('qcow2 module: Script execution failed with return code {}: {}'.format(result.returncode, result.stderr))
-        else:
-            log.info('qcow2 module: Script executed successfully.')
-        return ret
-    except Exception as e:
-        log.error('qcow2 module: An error occurred while executing the script: {}'.format(e))
-        raise
+    return _run_script(cmd)
 
 def create_volume_config(vm_name, size_gb, start=False):
     '''
@@ -307,29 +341,9 @@ def create_volume_config(vm_name, size_gb, start=False):
         - Final status of volume creation is logged
     '''
 
-    # Validate size_gb parameter
-    if not isinstance(size_gb, int) or size_gb <= 0:
-        raise ValueError('size_gb must be a positive integer.')
-
-    cmd = ['/usr/sbin/so-kvm-create-volume', '-v', vm_name, '-s', str(size_gb)]
+    cmd = ['/usr/sbin/so-kvm-create-volume', '-v', vm_name, '-s', _positive_int_arg(size_gb, 'size_gb')]
 
     if start:
         cmd.append('-S')
 
-    log.info('qcow2 module: Executing command: {}'.format(' '.join(shlex.quote(arg) for arg in cmd)))
-
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        ret = {
-            'retcode': result.returncode,
-            'stdout': result.stdout,
-            'stderr': result.stderr
-        }
-        if result.returncode != 0:
-            log.error('qcow2 module: Script execution failed with return code {}: {}'.format(result.returncode, result.stderr))
-        else:
-            log.info('qcow2 module: Script executed successfully.')
-        return ret
-    except Exception as e:
-        log.error('qcow2 module: An error occurred while executing the script: {}'.format(e))
-        raise
+    return _run_script(cmd)
@@ -62,37 +62,101 @@ Logging:
 """
 
 import base64
+import functools
 import hashlib
+import hmac
+import json
 import logging
+import mmap
 import os
 import pwd
+import queue
 import requests
 import salt.client
 import salt.utils.files
+import shutil
 import socket
 import sys
+import threading
 import time
 import yaml
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer LibYAML's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Configure logging
 log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
 
+@functools.lru_cache(maxsize=1)
+def _socore_ids():
+    """
+    Look up the socore user once per process.
+    Returns:
+        tuple: (uid, gid) of socore, or None if the user does not exist
+    """
+    try:
+        socore = pwd.getpwnam('socore')
+    except KeyError:
+        return None
+    return socore.pw_uid, socore.pw_gid
+
 def _set_ownership_and_perms(path: str, mode: int):
     """Set ownership to socore:socore and apply file mode."""
+    ids = _socore_ids()
+    if ids is None:
+        log.warning(f"socore user not found, skipping ownership/permission change for {path}")
+        return
     try:
-        socore_uid = pwd.getpwnam('socore').pw_uid
-        socore_gid = pwd.getpwnam('socore').pw_gid
-        os.chown(path, socore_uid, socore_gid)
+        os.chown(path, *ids)
         os.chmod(path, mode)
         log.debug(f"Set ownership socore:socore and mode {oct(mode)} for {path}")
-    except KeyError:
-        log.warning(f"socore user not found, skipping ownership/permission change for {path}")
     except Exception as e:
         log.warning(f"Failed to set ownership/permissions for {path}: {str(e)}")
 
+def _write_file(path: str, data: bytes, mode: int = None, owner: tuple = None) -> bool:
+    """
+    Create or truncate a file and write data to it through a single descriptor.
+    
+    The mode and owner are applied to the open descriptor before any data is
+    written, so the file never holds its contents with looser permissions.
+    
+    Args:
+        path: File to write
+        data: Contents to write
+        mode: File mode to set; None leaves the umask-based default
+        owner: (uid, gid) to set, or None to leave ownership unchanged
+        
+    Returns:
+        bool: True if the owner was set (or not requested), False if setting it failed
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+    owned = True
+    try:
+        if mode is not None:
+            # O_CREAT's mode only applies to new files
+            os.fchmod(fd, mode)
+        if owner is not None:
+            try:
+                os.fchown(fd, *owner)
+            except OSError as e:
+                log.warning(f"Failed to set ownership for {path}: {str(e)}")
+                owned = False
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return owned
+
 def _read_and_encode_key(key_path: str) -> str:
     """Read a key file and return its base64 encoded content."""
     try:
@@ -103,34 +167,62 @@ def _read_and_encode_key(key_path: str) -> str:
         log.error("Error reading key file %s: %s", key_path, str(e))
         raise
 
+# License path -> ((inode, mtime_ns, size), valid, message) for the last parse
+_license_cache = {}
+
+def _validate_license_data(license_data):
+    """
+    Check parsed license data for the required values.
+    Returns:
+        tuple: (valid, message) where message describes the outcome
+    """
+    if not license_data:
+        return False, "Empty or invalid license file"
+        
+    license_id = license_data.get('license_id')
+    features = license_data.get('features', [])
+    
+    if not license_id:
+        return False, "No license_id found in license file"
+        
+    if 'vrt' not in features:
+        return False, "vrt feature not found in license"
+        
+    return True, "License validation successful"
+
 def _check_license():
-    """Check if the license file exists and contains required values."""
+    """
+    Check if the license file exists and contains required values.
+    
+    The file is parsed again only when its inode, modification time or size
+    has changed since the last check in this process; an atomic rewrite
+    always gives it a new inode.
+    """
     license_path = '/opt/so/saltstack/local/pillar/soc/license.sls'
     
-    if not os.path.exists(license_path):
+    # One stat both checks that the file exists and identifies its version
+    try:
+        st = os.stat(license_path)
+    except OSError:
         log.error("License file not found at %s", license_path)
         return False
         
     try:
-        with salt.utils.files.fopen(license_path, 'r') as f:
-            license_data = yaml.safe_load(f)
-            
-        if not license_data:
-            log.error("Empty or invalid license file")
-            return False
-            
-        license_id = license_data.get('license_id')
-        features = license_data.get('features', [])
-        
-        if not license_id:
-            log.error("No license_id found in license file")
-            return False
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _license_cache.get(license_path)
+        if cached is not None and cached[0] == signature:
+            _, valid, message = cached
+        else:
+            with salt.utils.files.fopen(license_path, 'r') as f:
+                license_data = yaml.load(f, Loader=_YamlLoader)
+            valid, message = _validate_license_data(license_data)
+            _license_cache[license_path] = (signature, valid, message)
             
-        if 'vrt' not in features:
-            log.error("vrt feature not found in license")
+        if not valid:
+            log.error(message)
             return False
             
-        log.info("License validation successful")
+        log.info(message)
         return True
             
     except Exception as e:
@@ -144,31 +236,147 @@ def _check_file_exists(path):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     return False
 
-def _validate_image_checksum(path, expected_sha256):
+def _drop_cached_pages(f):
+    """
+    Let the kernel evict an open file's clean pages from the page cache.
+    
+    Used after streaming a multi-GB image once, so it does not push the
+    working set of salt and libvirt out of memory.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+def _sha256_file(path):
+    """
+    Compute the SHA-256 of a file.
+    Returns:
+        hashlib hash object for the file's contents
+    """
+    with salt.utils.files.fopen(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if USE_MMAP_HASH and size:
+            # Hash straight from the page cache in large windows, without
+            # copying each block into a new bytes object
+            sha256_hash = hashlib.sha256()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    # Read ahead aggressively on the mapping itself
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                for offset in range(0, size, MMAP_HASH_STEP):
+                    with view[offset:offset + MMAP_HASH_STEP] as window:
+                        sha256_hash.update(window)
+        elif hasattr(hashlib, 'file_digest'):
+            # Python 3.11+ hashes the file in C, reusing one buffer for every read
+            sha256_hash = hashlib.file_digest(f, 'sha256')
+        else:
+            sha256_hash = hashlib.sha256()
+            for chunk in iter(lambda: f.read(HASH_BLOCK), b''):
+                sha256_hash.update(chunk)
+        _drop_cached_pages(f)
+        return sha256_hash
+
+def _verified_marker_matches(path, expected_sha256):
+    """
+    Check whether a file's verification marker still describes it.
+    
+    The marker (path + '.verified') records the size, mtime and SHA-256 of the
+    file when its checksum last passed.
+    Returns:
+        bool: True if the file is unchanged since it was verified, False otherwise
+    """
+    try:
+        with salt.utils.files.fopen(path + '.verified', 'r') as f:
+            marker = json.load(f)
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return (isinstance(marker, dict)
+            and marker.get('sha256') == expected_sha256
+            and marker.get('size') == st.st_size
+            and marker.get('mtime_ns') == st.st_mtime_ns)
+
+def _write_verified_marker(path, sha256):
+    """Record that a file's checksum passed, for _verified_marker_matches."""
+    try:
+        st = os.stat(path)
+        with salt.utils.files.fopen(path + '.verified', 'w') as f:
+            json.dump({'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': sha256}, f)
+    except OSError as e:
+        log.warning("Failed to write verification marker for %s: %s", path, str(e))
+
+def _remove_verified_marker(path):
+    """Remove a file's verification marker, if any."""
+    try:
+        os.unlink(path + '.verified')
+    except FileNotFoundError:
+        pass
+
+def _validate_image_checksum(path, expected_sha256, expected_digest):
     """
     Validate the checksum of an existing image file.
+    
+    Hashing is skipped when the file's verification marker shows it has not
+    changed since its checksum last passed.
+    Args:
+        path: Image file to check
+        expected_sha256: Expected SHA256 as hex, recorded in the marker
+        expected_digest: The same checksum as raw bytes, converted once by
+            the caller
     Returns:
         bool: True if checksum matches, False otherwise
     """
-    sha256_hash = hashlib.sha256()
-    with salt.utils.files.fopen(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
-            sha256_hash.update(chunk)
+    if _verified_marker_matches(path, expected_sha256):
+        log.info("Checksum previously validated for %s", path)
+        return True
+
+    sha256_hash = _sha256_file(path)
     
-    downloaded_sha256 = sha256_hash.hexdigest()
-    if downloaded_sha256 != expected_sha256:
+    # Compare raw digests; the hex form is only needed for the error message
+    if not hmac.compare_digest(sha256_hash.digest(), expected_digest):
         log.error("Checksum validation failed for %s - expected: %s, got: %s",
-                 path, expected_sha256, downloaded_sha256)
+                 path, expected_sha256, sha256_hash.hexdigest())
         return False
     
     log.info("Checksum validation successful for %s", path)
+    _write_verified_marker(path, expected_sha256)
     return True
 
 # Constants
 IMAGE_URL = "https://download.securityonion.net/file/securityonion/OL9U5_x86_64-kvm-b253.qcow2"
 IMAGE_SHA256 = "3b00bbbefc8e78dd28d9f538834fb9e2a03d5ccdc2cadf2ffd0036c0a8f02021"
 IMAGE_PATH = "/nsm/libvirt/boot/OL9U5_x86_64-kvm-b253.qcow2"
+_EXPECTED_SHA256_BYTES = bytes.fromhex(IMAGE_SHA256)
 MANAGER_HOSTNAME = socket.gethostname()
+# Block size for reading, downloading and hashing images (8 MiB)
+HASH_BLOCK = 8 * 1024 * 1024
+# Hash images through mmap in MMAP_HASH_STEP windows instead of
+# hashlib.file_digest (or buffered reads before Python 3.11). Off by default:
+# file_digest already hashes in C, and the mapping raises the process RSS
+USE_MMAP_HASH = False
+MMAP_HASH_STEP = 64 * 1024 * 1024
+# Bytes downloaded between progress log messages
+LOG_INTERVAL_BYTES = 64 * 1024 * 1024
+
+# Shared HTTP session for image downloads, reusing connections and retrying
+# transient failures
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=5, backoff_factor=1), pool_maxsize=4))
+
+def _hash_chunks(sha256_hash, chunks, errors):
+    """
+    Update a hash with chunks taken from a queue until None is received.
+    
+    An exception from the hash is appended to errors, and the queue is still
+    drained up to the None sentinel so the producer never blocks on put().
+    """
+    chunk_iter = iter(chunks.get, None)
+    try:
+        for chunk in chunk_iter:
+            sha256_hash.update(chunk)
+    except Exception as e:
+        errors.append(e)
+        for _ in chunk_iter:
+            pass
 
 def _download_image():
     """
@@ -178,43 +386,74 @@ def _download_image():
     """
     # Check if file already exists and validate checksum
     if _check_file_exists(IMAGE_PATH):
-        if _validate_image_checksum(IMAGE_PATH, IMAGE_SHA256):
+        if _validate_image_checksum(IMAGE_PATH, IMAGE_SHA256, _EXPECTED_SHA256_BYTES):
             return True
         else:
             log.warning("Existing image has invalid checksum, will re-download")
             os.unlink(IMAGE_PATH)
     
+    _remove_verified_marker(IMAGE_PATH)
     log.info("Starting image download process")
 
     try:
         # Download file
         log.info("Downloading Oracle Linux KVM image from %s to %s", IMAGE_URL, IMAGE_PATH)
-        response = requests.get(IMAGE_URL, stream=True)
+        # The image is already compressed; ask for it as-is so content-length
+        # matches what is written
+        response = _SESSION.get(IMAGE_URL, stream=True, headers={'Accept-Encoding': 'identity'},
+                                timeout=(10, 60))
         response.raise_for_status()
 
         # Get total file size for progress tracking
         total_size = int(response.headers.get('content-length', 0))
         downloaded_size = 0
-        last_log_time = 0
+        bytes_since_log = 0
 
-        # Save file with progress logging
-        with salt.utils.files.fopen(IMAGE_PATH, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded_size += len(chunk)
-                
-                # Log progress every second
-                current_time = time.time()
-                if current_time - last_log_time >= 1:
-                    progress = (downloaded_size / total_size) * 100 if total_size > 0 else 0
-                    log.info("Progress - %.1f%% (%d/%d bytes)", 
-                            progress, downloaded_size, total_size)
-                    last_log_time = current_time
+        # Save file with progress logging, hashing each chunk as it is written
+        # so the image does not have to be read back for validation. Hashing
+        # runs on a separate thread (hashlib releases the GIL for large
+        # buffers) so it overlaps with the network reads and disk writes.
+        sha256_hash = hashlib.sha256()
+        chunks = queue.Queue(maxsize=4)
+        hash_errors = []
+        hasher = threading.Thread(target=_hash_chunks, args=(sha256_hash, chunks, hash_errors),
+                                  daemon=True)
+        hasher.start()
+        try:
+            with salt.utils.files.fopen(IMAGE_PATH, 'wb', buffering=HASH_BLOCK) as f:
+                # Reserve the whole image up front to limit fragmentation
+                if total_size > 0 and hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+                for chunk in response.iter_content(chunk_size=HASH_BLOCK):
+                    f.write(chunk)
+                    chunks.put(chunk)
+                    downloaded_size += len(chunk)
+                    bytes_since_log += len(chunk)
+                    
+                    # Log progress every LOG_INTERVAL_BYTES, without a clock call per chunk
+                    if bytes_since_log >= LOG_INTERVAL_BYTES:
+                        progress = (downloaded_size / total_size) * 100 if total_size > 0 else 0
+                        log.info("Progress - %.1f%% (%d/%d bytes)", 
+                                progress, downloaded_size, total_size)
+                        bytes_since_log = 0
+                # Drop any reserved space the download did not fill
+                f.truncate()
+                f.flush()
+                _drop_cached_pages(f)
+        finally:
+            chunks.put(None)
+            hasher.join()
+        if hash_errors:
+            raise hash_errors[0]
 
         # Validate downloaded file
-        if not _validate_image_checksum(IMAGE_PATH, IMAGE_SHA256):
+        if not hmac.compare_digest(sha256_hash.digest(), _EXPECTED_SHA256_BYTES):
+            log.error("Checksum validation failed for %s - expected: %s, got: %s",
+                     IMAGE_PATH, IMAGE_SHA256, sha256_hash.hexdigest())
             os.unlink(IMAGE_PATH)
             return False
+        log.info("Checksum validation successful for %s", IMAGE_PATH)
+        _write_verified_marker(IMAGE_PATH, IMAGE_SHA256)
 
         log.info("Successfully downloaded and validated Oracle Linux KVM image")
         return True
@@ -225,6 +464,29 @@ def _download_image():
             os.unlink(IMAGE_PATH)
         return False
 
+def _copy_file(src_path, dst_path):
+    """Copy a file's contents, within the kernel via os.sendfile on Linux."""
+    if not sys.platform.startswith('linux'):
+        with salt.utils.files.fopen(src_path, 'rb') as src:
+            with salt.utils.files.fopen(dst_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+        return
+
+    src_fd = os.open(src_path, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            offset = 0
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, 1 << 20)
+                if not sent:
+                    break
+                offset += sent
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
 def _check_ssh_keys_exist():
     """
     Check if SSH keys already exist.
@@ -285,16 +547,9 @@ def _setup_ssh_keys():
         )
         public_bytes = public_bytes + f' soqemussh@{MANAGER_HOSTNAME}\n'.encode('utf-8')
 
-        # Write the keys to files
-        with salt.utils.files.fopen(key_path, 'wb') as f:
-            f.write(private_bytes)
-
-        with salt.utils.files.fopen(pub_key_path, 'wb') as f:
-            f.write(public_bytes)
-
-        # Set proper permissions
-        os.chmod(key_path, 0o600)
-        os.chmod(pub_key_path, 0o640)
+        # Write the keys to files with proper permissions
+        _write_file(key_path, private_bytes, mode=0o600)
+        _write_file(pub_key_path, public_bytes, mode=0o640)
 
         log.info("SSH keys generated successfully")
 
@@ -303,9 +558,7 @@ def _setup_ssh_keys():
         os.makedirs(dest_dir, exist_ok=True)
         dest_path = os.path.join(dest_dir, os.path.basename(pub_key_path))
         
-        with salt.utils.files.fopen(pub_key_path, 'rb') as src:
-            with salt.utils.files.fopen(dest_path, 'wb') as dst:
-                dst.write(src.read())
+        _copy_file(pub_key_path, dest_path)
         
         log.info("Public key copied to %s", dest_dir)
         return True
@@ -322,18 +575,23 @@ def _check_vm_exists(vm_name: str) -> bool:
     """
     base_dir = '/opt/so/saltstack/local/salt/libvirt/images'
     vm_dir = f'{base_dir}/{vm_name}'
-    vm_image = os.path.join(vm_dir, f'{vm_name}.qcow2')
-    cidata_iso = os.path.join(vm_dir, f'{vm_name}-cidata.iso')
     
-    required_files = [
-        vm_image,
-        cidata_iso,
-        os.path.join(vm_dir, 'meta-data'),
-        os.path.join(vm_dir, 'user-data'),
-        os.path.join(vm_dir, 'network-data')
-    ]
+    required_files = {
+        f'{vm_name}.qcow2',
+        f'{vm_name}-cidata.iso',
+        'meta-data',
+        'user-data',
+        'network-data'
+    }
     
-    exists = all(os.path.exists(f) for f in required_files)
+    # List the directory once rather than checking each file separately
+    try:
+        with os.scandir(vm_dir) as entries:
+            names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    
+    exists = required_files <= names
     if exists:
         log.info("VM %s already exists", vm_name)
     return exists
@@ -368,18 +626,14 @@ def _ensure_hypervisor_host_dir(minion_id: str = None):
             # Create the VMs file if it doesn't exist
             vms_file = f'/opt/so/saltstack/local/salt/hypervisor/hosts/{hostname}VMs'
             if not os.path.exists(vms_file):
-                with salt.utils.files.fopen(vms_file, 'w') as f:
-                    f.write('[]')
+                # Create the VMs file owned by socore:socore
+                ids = _socore_ids()
+                owned = _write_file(vms_file, b'[]', owner=ids)
                 log.info(f"Created empty VMs file: {vms_file}")
-                
-                # Set proper ownership for the VMs file
-                try:
-                    socore_uid = pwd.getpwnam('socore').pw_uid
-                    socore_gid = pwd.getpwnam('socore').pw_gid
-                    os.chown(vms_file, socore_uid, socore_gid)
+                if ids is None:
+                    log.warning("Failed to set ownership for VMs file: socore user not found")
+                elif owned:
                     log.info(f"Set ownership to socore:socore for {vms_file}")
-                except (KeyError, Exception) as e:
-                    log.warning(f"Failed to set ownership for VMs file: {str(e)}")
             return True
             
         # Create all necessary parent directories
@@ -387,130 +641,125 @@ def _ensure_hypervisor_host_dir(minion_id: str = None):
         log.info(f"Created hypervisor host directory: {host_dir}")
         
         # Create the VMs file with an empty JSON array
+        # owned by socore:socore where possible
+        ids = _socore_ids()
         vms_file = f'/opt/so/saltstack/local/salt/hypervisor/hosts/{hostname}VMs'
-        with salt.utils.files.fopen(vms_file, 'w') as f:
-            f.write('[]')
+        owned = _write_file(vms_file, b'[]', owner=ids)
         log.info(f"Created empty VMs file: {vms_file}")
         
         # Set proper ownership (socore:socore)
-        try:
-            socore_uid = pwd.getpwnam('socore').pw_uid
-            socore_gid = pwd.getpwnam('socore').pw_gid
-            os.chown(host_dir, socore_uid, socore_gid)
-            os.chown(vms_file, socore_uid, socore_gid)
-            
-            # Also set ownership for parent directories if they were just created
-            parent_dir = os.path.dirname(host_dir)  # /opt/so/saltstack/local/salt/hypervisor/hosts
-            if os.path.exists(parent_dir):
-                os.chown(parent_dir, socore_uid, socore_gid)
-                
-            parent_dir = os.path.dirname(parent_dir)  # /opt/so/saltstack/local/salt/hypervisor
-            if os.path.exists(parent_dir):
-                os.chown(parent_dir, socore_uid, socore_gid)
-                
-            log.info(f"Set ownership to socore:socore for {host_dir} and {vms_file}")
-        except KeyError:
+        if ids is None:
             log.warning("socore user not found, skipping ownership change")
-        except Exception as e:
-            log.warning(f"Failed to set ownership: {str(e)}")
+        else:
+            try:
+                os.chown(host_dir, *ids)
+                
+                # Also set ownership for parent directories if they were just created
+                parent_dir = os.path.dirname(host_dir)  # /opt/so/saltstack/local/salt/hypervisor/hosts
+                if os.path.exists(parent_dir):
+                    os.chown(parent_dir, *ids)
+                    
+                parent_dir = os.path.dirname(parent_dir)  # /opt/so/saltstack/local/salt/hypervisor
+                if os.path.exists(parent_dir):
+                    os.chown(parent_dir, *ids)
+                    
+                if owned:
+                    log.info(f"Set ownership to socore:socore for {host_dir} and {vms_file}")
+                else:
+                    # _write_file has already logged why the VMs file could not be chowned
+                    log.info(f"Set ownership to socore:socore for {host_dir}")
+            except Exception as e:
+                log.warning(f"Failed to set ownership: {str(e)}")
             
         return True
     except Exception as e:
         log.error(f"Error creating hypervisor host directory: {str(e)}")
         return False
 
-def _apply_dyanno_hypervisor_state():
+def _check_state_result(state_name, state_result):
     """
-    Apply the soc.dyanno.hypervisor state on the salt master.
-    
-    This function applies the soc.dyanno.hypervisor state on the salt master
-    to update the hypervisor annotation and ensure all hypervisor host directories exist.
+    Check the per-minion results of a state.apply job.
     
+    Args:
+        state_name (str): Name of the applied state, for logging
+        state_result (dict): Minion ID -> state return
+        
     Returns:
-        bool: True if state was applied successfully, False otherwise
+        bool: True if every state succeeded on every minion, False otherwise
     """
-    try:
-        log.info("Applying soc.dyanno.hypervisor state on salt master")
-        
-        # Initialize the LocalClient
-        local = salt.client.LocalClient()
-        
-        # Target the salt master to apply the soc.dyanno.hypervisor state
-        target = MANAGER_HOSTNAME + '_*'
-        state_result = local.cmd(target, 'state.apply', ['soc.dyanno.hypervisor', "pillar={'baseDomain': {'status': 'PreInit'}}", 'concurrent=True'], tgt_type='glob')
-        log.debug(f"state_result: {state_result}")
-        # Check if state was applied successfully
-        if state_result:
-            success = True
-            for minion, states in state_result.items():
-                if not isinstance(states, dict):
-                    log.error(f"Unexpected result format from {minion}: {states}")
-                    success = False
-                    continue
-                    
-                for state_id, state_data in states.items():
-                    if not state_data.get('result', False):
-                        log.error(f"State {state_id} failed on {minion}: {state_data.get('comment', 'No comment')}")
-                        success = False
-            
-            if success:
-                log.info("Successfully applied soc.dyanno.hypervisor state")
-                return True
-            else:
-                log.error("Failed to apply soc.dyanno.hypervisor state")
-                return False
-        else:
-            log.error("No response from salt master when applying soc.dyanno.hypervisor state")
-            return False
-            
-    except Exception as e:
-        log.error(f"Error applying soc.dyanno.hypervisor state: {str(e)}")
+    if not state_result:
+        log.error(f"No response from salt master when applying {state_name} state")
         return False
 
-def _apply_cloud_config_state():
+    success = True
+    for minion, states in state_result.items():
+        if not isinstance(states, dict):
+            log.error(f"Unexpected result format from {minion}: {states}")
+            success = False
+            continue
+            
+        for state_id, state_data in states.items():
+            if not state_data.get('result', False):
+                log.error(f"State {state_id} failed on {minion}: {state_data.get('comment', 'No comment')}")
+                success = False
+    
+    if success:
+        log.info(f"Successfully applied {state_name} state")
+    else:
+        log.error(f"Failed to apply {state_name} state")
+    return success
+
+def _apply_master_states(states):
     """
-    Apply the salt.cloud.config state on the salt master.
+    Apply states on the salt master concurrently.
+    
+    Every state.apply job is published before waiting on any of them, so the
+    states run side by side (they are applied with concurrent=True) instead of
+    one after the other. Jobs are published with listen=True so the client is
+    subscribed to the event bus before the first publish; returns for a job
+    that finishes while an earlier one is being waited on are buffered rather
+    than missed.
     
+    Args:
+        states (list): (state name, extra state.apply arguments) pairs
+        
     Returns:
-        bool: True if state was applied successfully, False otherwise
+        dict: State name -> True if it was applied successfully, False otherwise
     """
+    results = {}
     try:
-        log.info("Applying salt.cloud.config state on salt master")
-        
         # Initialize the LocalClient
         local = salt.client.LocalClient()
-        
-        # Target the salt master to apply the soc.dyanno.hypervisor state
-        target = MANAGER_HOSTNAME + '_*'
-        state_result = local.cmd(target, 'state.apply', ['salt.cloud.config', 'concurrent=True'], tgt_type='glob')
-        log.debug(f"state_result: {state_result}")
-        # Check if state was applied successfully
-        if state_result:
-            success = True
-            for minion, states in state_result.items():
-                if not isinstance(states, dict):
-                    log.error(f"Unexpected result format from {minion}: {states}")
-                    success = False
-                    continue
-                    
-                for state_id, state_data in states.items():
-                    if not state_data.get('result', False):
-                        log.error(f"State {state_id} failed on {minion}: {state_data.get('comment', 'No comment')}")
-                        success = False
-            
-            if success:
-                log.info("Successfully applied salt.cloud.config state")
-                return True
-            else:
-                log.error("Failed to apply salt.cloud.config state")
-                return False
-        else:
-            log.error("No response from salt master when applying salt.cloud.config state")
-            return False
-            
     except Exception as e:
-        log.error(f"Error applying salt.cloud.config state: {str(e)}")
-        return False
+        log.error(f"Error applying states on salt master: {str(e)}")
+        return {state_name: False for state_name, _ in states}
+
+    # Target the salt master
+    target = MANAGER_HOSTNAME + '_*'
+    jobs = []
+    for state_name, args in states:
+        try:
+            log.info(f"Applying {state_name} state on salt master")
+            pub_data = local.run_job(target, 'state.apply', [state_name] + args + ['concurrent=True'], tgt_type='glob', listen=True)
+            jobs.append((state_name, pub_data))
+        except Exception as e:
+            log.error(f"Error applying {state_name} state: {str(e)}")
+            results[state_name] = False
+
+    for state_name, pub_data in jobs:
+        try:
+            state_result = {}
+            if pub_data:
+                for fn_ret in local.get_cli_event_returns(pub_data['jid'], pub_data['minions'], local.opts['timeout']):
+                    for minion, data in (fn_ret or {}).items():
+                        state_result[minion] = data.get('ret', {})
+            log.debug(f"state_result: {state_result}")
+            results[state_name] = _check_state_result(state_name, state_result)
+        except Exception as e:
+            log.error(f"Error applying {state_name} state: {str(e)}")
+            results[state_name] = False
+
+    return results
 
 def setup_environment(vm_name: str = 'sool9', disk_size: str = '220G', minion_id: str = None):
     """
@@ -593,21 +842,21 @@ def setup_environment(vm_name: str = 'sool9', disk_size: str = '220G', minion_id
         if not mine_update_success:
             log.error(f"mine.update failed after {max_retries} attempts")
 
-    # Apply the soc.dyanno.hypervisor state on the salt master
-    if not _apply_cloud_config_state():
-        log.warning("Failed to apply salt.cloud.config state, continuing with setup")
-        # We don't return an error here as we want to continue with the setup process
-
-    # Apply the soc.dyanno.hypervisor state on the salt master
-    if not _apply_dyanno_hypervisor_state():
-        log.warning("Failed to apply soc.dyanno.hypervisor state, continuing with setup")
-        # We don't return an error here as we want to continue with the setup process
+    # Apply the salt.cloud.config and soc.dyanno.hypervisor states on the salt master.
+    # We don't return an error for either as we want to continue with the setup process
+    state_results = _apply_master_states([
+        ('salt.cloud.config', []),
+        ('soc.dyanno.hypervisor', ["pillar={'baseDomain': {'status': 'PreInit'}}"]),
+    ])
+    for state_name, applied in state_results.items():
+        if not applied:
+            log.warning(f"Failed to apply {state_name} state, continuing with setup")
 
     log.info("Starting setup_environment in setup_hypervisor runner")
     
     # Check if environment is already set up
     image_exists = _check_file_exists(IMAGE_PATH)
-    image_valid = image_exists and _validate_image_checksum(IMAGE_PATH, IMAGE_SHA256)
+    image_valid = image_exists and _validate_image_checksum(IMAGE_PATH, IMAGE_SHA256, _EXPECTED_SHA256_BYTES)
     keys_exist = _check_ssh_keys_exist()
     vm_exists = _check_vm_exists(vm_name)
 
@@ -780,7 +1029,7 @@ def create_vm(vm_name: str, disk_size: str = '220G'):
         try:
             if os.path.exists(pillar_path):
                 with salt.utils.files.fopen(pillar_path, 'r') as f:
-                    pillar_data = yaml.safe_load(f)
+                    pillar_data = yaml.load(f, Loader=_YamlLoader)
                     if pillar_data:
                         password_hash = pillar_data.get('vm', {}).get('user', {}).get('soqemussh', {}).get('passwordHash')
             if password_hash:
@@ -1001,10 +1250,7 @@ power_state:
         log.info("Created cidata ISO")
 
         # Generate SHA256 hash of the qcow2 image
-        sha256_hash = hashlib.sha256()
-        with salt.utils.files.fopen(vm_image, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256_hash.update(chunk)
+        sha256_hash = _sha256_file(vm_image)
         
         # Write hash to file
         hash_file = os.path.join(vm_dir, f'{vm_name}.sha256')
@@ -12,7 +12,7 @@ Includes:
 """
 
 from .entities import Entity, AggregateRoot, ValueObject
-from .repositories import Repository, ReadOnlyRepository
+from .repositories import Repository, ReadOnlyRepository, RepositoryError
 from .services import DomainService, ApplicationService, QueryService, CommandHandler
 
 __all__ = [
@@ -23,6 +23,7 @@ __all__ = [
     # Repositories
     'Repository',
     'ReadOnlyRepository',
+    'RepositoryError',
     # Services
     'DomainService',
     'ApplicationService',
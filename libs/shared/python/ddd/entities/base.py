@@ -8,16 +8,18 @@ across bounded contexts in the modular monolith.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Generic, List, Optional, TypeVar
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValueObject(ABC):
     """
     Abstract base class for Value Objects.
     
     Value Objects are immutable and compared by their attribute values
     rather than identity. They represent descriptive aspects of the domain.
+    Subclasses decorated with ``@dataclass(frozen=True)`` get field-wise
+    ``__eq__`` and ``__hash__`` generated by the dataclass.
     
     Example:
         @dataclass(frozen=True)
@@ -25,20 +27,12 @@ class ValueObject(ABC):
             value: int
             colors: tuple[str, ...]
     """
-    
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, self.__class__):
-            return False
-        return self.__dict__ == other.__dict__
-    
-    def __hash__(self) -> int:
-        return hash(tuple(sorted(self.__dict__.items())))
 
 
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity(ABC, Generic[T]):
     """
     Abstract base class for Domain Entities.
@@ -88,7 +82,7 @@ class DomainEvent:
             self.event_type = self.__class__.__name__
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateRoot(Entity[T], Generic[T]):
     """
     Abstract base class for Aggregate Roots.
@@ -100,23 +94,31 @@ class AggregateRoot(Entity[T], Generic[T]):
     - Domain event collection for eventual consistency
     - Version tracking for optimistic concurrency
     """
-    _domain_events: List[DomainEvent] = field(default_factory=list, repr=False)
+    # Created on the first add_domain_event; read-only loads never allocate it
+    _domain_events: Optional[List[DomainEvent]] = field(default=None, repr=False)
     _version: int = field(default=0, repr=False)
     
     def add_domain_event(self, event: DomainEvent) -> None:
         """Add a domain event to be dispatched after persistence."""
+        if self._domain_events is None:
+            self._domain_events = []
         self._domain_events.append(event)
     
     def clear_domain_events(self) -> List[DomainEvent]:
         """Clear and return all pending domain events."""
-        events = self._domain_events.copy()
-        self._domain_events.clear()
+        events = self._domain_events
+        if not events:
+            return []
+        # Hand the list itself to the caller instead of copying it
+        self._domain_events = None
         return events
     
     @property
-    def domain_events(self) -> List[DomainEvent]:
-        """Get pending domain events."""
-        return self._domain_events.copy()
+    def domain_events(self) -> Tuple[DomainEvent, ...]:
+        """Get a read-only snapshot of pending domain events."""
+        if not self._domain_events:
+            return ()
+        return tuple(self._domain_events)
     
     @property
     def version(self) -> int:
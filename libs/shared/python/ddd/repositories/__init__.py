@@ -5,9 +5,10 @@ Provides abstract repository interfaces for data access following
 the Repository pattern from Domain-Driven Design.
 """
 
-from .base import Repository, ReadOnlyRepository
+from .base import Repository, ReadOnlyRepository, RepositoryError
 
 __all__ = [
     'Repository',
     'ReadOnlyRepository',
+    'RepositoryError',
 ]
@@ -7,7 +7,7 @@ affecting the domain layer.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
+from typing import Dict, Generic, List, Optional, Sequence, TypeVar
 
 from ..entities.base import Entity, AggregateRoot
 
@@ -15,6 +15,16 @@ T = TypeVar('T', bound=Entity)
 ID = TypeVar('ID')
 
 
+class RepositoryError(Exception):
+    """
+    Raised by repository implementations when the data store fails.
+    
+    Implementations wrap backend errors (e.g. Django's DatabaseError) in
+    this type so callers can handle storage failures without catching
+    every exception.
+    """
+
+
 class ReadOnlyRepository(ABC, Generic[T, ID]):
     """
     Abstract read-only repository interface.
@@ -36,6 +46,28 @@ class ReadOnlyRepository(ABC, Generic[T, ID]):
         """
         pass
     
+    def get_many(self, entity_ids: Sequence[ID]) -> Dict[ID, T]:
+        """
+        Retrieve several entities by their identifiers in one call.
+        
+        The default implementation falls back to one ``get_by_id`` call
+        per identifier. Implementations backed by a database should
+        override it with a single batched query (``WHERE id IN (...)``).
+        
+        Args:
+            entity_ids: The unique identifiers of the entities.
+            
+        Returns:
+            Mapping of identifier to entity for every entity found.
+            Missing identifiers are omitted.
+        """
+        entities: Dict[ID, T] = {}
+        for entity_id in entity_ids:
+            entity = self.get_by_id(entity_id)
+            if entity is not None:
+                entities[entity_id] = entity
+        return entities
+    
     @abstractmethod
     def get_all(self, limit: Optional[int] = None, offset: int = 0) -> List[T]:
         """